@@ -8,9 +8,12 @@ from .integer_slider import NODE_CLASS_MAPPINGS as IntegerSliderMappings, NODE_D
 from .float_to_int import NODE_CLASS_MAPPINGS as FloatToIntMappings, NODE_DISPLAY_NAME_MAPPINGS as FloatToIntDisplayMappings
 from .int_to_float import NODE_CLASS_MAPPINGS as IntToFloatMappings, NODE_DISPLAY_NAME_MAPPINGS as IntToFloatDisplayMappings
 from .dashboard_node import NODE_CLASS_MAPPINGS as DashboardSingleMappings, NODE_DISPLAY_NAME_MAPPINGS as DashboardSingleDisplayMappings
+# Registers its on_prompt handler after Dashboard Get linking and before Image Selector prefetch
+from . import prompt_pruner
 from .dropdown import NODE_CLASS_MAPPINGS as DropdownMappings, NODE_DISPLAY_NAME_MAPPINGS as DropdownDisplayMappings
 from .custom_dropdown import NODE_CLASS_MAPPINGS as CustomDropdownMappings, NODE_DISPLAY_NAME_MAPPINGS as CustomDropdownDisplayMappings
 from .image_selector import NODE_CLASS_MAPPINGS as ImageSelectorMappings, NODE_DISPLAY_NAME_MAPPINGS as ImageSelectorDisplayMappings
+from .image_folder import NODE_CLASS_MAPPINGS as ImageFolderMappings, NODE_DISPLAY_NAME_MAPPINGS as ImageFolderDisplayMappings
 from .passthrough import NODE_CLASS_MAPPINGS as PassthroughMappings, NODE_DISPLAY_NAME_MAPPINGS as PassthroughDisplayMappings
 from .switch import NODE_CLASS_MAPPINGS as SwitchMappings, NODE_DISPLAY_NAME_MAPPINGS as SwitchDisplayMappings
 from .compare import NODE_CLASS_MAPPINGS as CompareMappings, NODE_DISPLAY_NAME_MAPPINGS as CompareDisplayMappings
@@ -19,7 +22,9 @@ from .execute_switch import NODE_CLASS_MAPPINGS as ExecuteSwitchMappings, NODE_D
 from .execute_block import NODE_CLASS_MAPPINGS as ExecuteBlockMappings, NODE_DISPLAY_NAME_MAPPINGS as ExecuteBlockDisplayMappings
 from .string_node import NODE_CLASS_MAPPINGS as StringNodeMappings, NODE_DISPLAY_NAME_MAPPINGS as StringNodeDisplayMappings
 from .map_dropdown import NODE_CLASS_MAPPINGS as MapDropdownMappings, NODE_DISPLAY_NAME_MAPPINGS as MapDropdownDisplayMappings
+from .preset_table import NODE_CLASS_MAPPINGS as PresetTableMappings, NODE_DISPLAY_NAME_MAPPINGS as PresetTableDisplayMappings
 from . import preferences
+from . import routes
 
 
 
@@ -33,6 +38,7 @@ NODE_CLASS_MAPPINGS.update(DashboardSingleMappings)
 NODE_CLASS_MAPPINGS.update(DropdownMappings)
 NODE_CLASS_MAPPINGS.update(CustomDropdownMappings)
 NODE_CLASS_MAPPINGS.update(ImageSelectorMappings)
+NODE_CLASS_MAPPINGS.update(ImageFolderMappings)
 NODE_CLASS_MAPPINGS.update(PassthroughMappings)
 NODE_CLASS_MAPPINGS.update(SwitchMappings)
 NODE_CLASS_MAPPINGS.update(CompareMappings)
@@ -41,6 +47,7 @@ NODE_CLASS_MAPPINGS.update(ExecuteSwitchMappings)
 NODE_CLASS_MAPPINGS.update(ExecuteBlockMappings)
 NODE_CLASS_MAPPINGS.update(StringNodeMappings)
 NODE_CLASS_MAPPINGS.update(MapDropdownMappings)
+NODE_CLASS_MAPPINGS.update(PresetTableMappings)
 
 
 
@@ -54,6 +61,7 @@ NODE_DISPLAY_NAME_MAPPINGS.update(DashboardSingleDisplayMappings)
 NODE_DISPLAY_NAME_MAPPINGS.update(DropdownDisplayMappings)
 NODE_DISPLAY_NAME_MAPPINGS.update(CustomDropdownDisplayMappings)
 NODE_DISPLAY_NAME_MAPPINGS.update(ImageSelectorDisplayMappings)
+NODE_DISPLAY_NAME_MAPPINGS.update(ImageFolderDisplayMappings)
 NODE_DISPLAY_NAME_MAPPINGS.update(PassthroughDisplayMappings)
 NODE_DISPLAY_NAME_MAPPINGS.update(SwitchDisplayMappings)
 NODE_DISPLAY_NAME_MAPPINGS.update(CompareDisplayMappings)
@@ -62,6 +70,7 @@ NODE_DISPLAY_NAME_MAPPINGS.update(ExecuteSwitchDisplayMappings)
 NODE_DISPLAY_NAME_MAPPINGS.update(ExecuteBlockDisplayMappings)
 NODE_DISPLAY_NAME_MAPPINGS.update(StringNodeDisplayMappings)
 NODE_DISPLAY_NAME_MAPPINGS.update(MapDropdownDisplayMappings)
+NODE_DISPLAY_NAME_MAPPINGS.update(PresetTableDisplayMappings)
 
 
 
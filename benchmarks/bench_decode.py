@@ -0,0 +1,63 @@
+"""
+Microbenchmark for the Image Selector decode path.
+
+Compares the original decode (exif_transpose + astype + divide) with image_decode.decode_image,
+both at full resolution and with JPEG draft decoding towards a 512x512 target.
+Runs standalone, no ComfyUI needed:
+
+    python benchmarks/bench_decode.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import torch
+from PIL import Image, ImageOps
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from image_decode import decode_image  # noqa: E402
+
+SIZES = [(1024, 1024), (2048, 2048), (3840, 2160)]
+REPEATS = 5
+
+def baseline_decode(path):
+    i = Image.open(path)
+    i = ImageOps.exif_transpose(i)
+    image = i.convert("RGB")
+    image = np.array(image).astype(np.float32) / 255.0
+    return torch.from_numpy(image)[None,]
+
+def best_time(fn, *args):
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'size':>11} {'format':>6} {'baseline':>12} {'fast':>12} {'fast+draft':>12}   (ms per megapixel)")
+        for width, height in SIZES:
+            # Smooth gradient plus noise compresses like a photo rather than pure noise
+            x = np.linspace(0, 255, width, dtype=np.float32)[None, :, None]
+            y = np.linspace(0, 255, height, dtype=np.float32)[:, None, None]
+            noise = np.random.default_rng(0).normal(0, 12, (height, width, 3))
+            pixels = np.clip((x + y) / 2 + noise, 0, 255).astype(np.uint8)
+            megapixels = width * height / 1e6
+
+            for ext in ("png", "jpg"):
+                path = os.path.join(tmp, f"bench_{width}x{height}.{ext}")
+                Image.fromarray(pixels).save(path)
+
+                assert torch.equal(baseline_decode(path), decode_image(path))
+
+                baseline = best_time(baseline_decode, path) * 1000 / megapixels
+                fast = best_time(decode_image, path) * 1000 / megapixels
+                draft = best_time(decode_image, path, (512, 512)) * 1000 / megapixels
+                print(f"{width:>5}x{height:<5} {ext:>6} {baseline:>12.2f} {fast:>12.2f} {draft:>12.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Microbenchmark for the MapDropdown selection path.
+
+Compares the original per-run lookup (json.loads + list.index) with the memoized
+value -> index dict used by MapDropdown / MapDropdownUnbounded, as the option count grows.
+The node itself is also checked to pull only the selected option.
+Runs standalone, no ComfyUI needed:
+
+    python benchmarks/bench_map_dropdown.py
+"""
+import importlib.util
+import json
+import os
+import sys
+import time
+import types
+
+# map_dropdown uses package-relative imports, load the package directory without running
+# __init__.py (which needs a ComfyUI server)
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+package = types.ModuleType("crz_bench")
+package.__path__ = [PACKAGE_DIR]
+sys.modules["crz_bench"] = package
+spec = importlib.util.spec_from_file_location("crz_bench.map_dropdown", os.path.join(PACKAGE_DIR, "map_dropdown.py"))
+map_dropdown = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = map_dropdown
+spec.loader.exec_module(map_dropdown)
+
+OPTION_COUNTS = [10, 50, 100, 250, 1000]
+CALLS = 20000
+
+def baseline_index(selected_value, dropdown_options_str):
+    dropdown_options = json.loads(dropdown_options_str)
+    return dropdown_options.index(selected_value) if selected_value in dropdown_options else 0
+
+def time_per_call(fn, *args):
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        fn(*args)
+    return (time.perf_counter() - start) / CALLS * 1e6
+
+def main():
+    node = map_dropdown.MapDropdownUnbounded()
+    print(f"{'options':>8} {'baseline':>10} {'lookup':>10}   (us per call, last option selected)")
+    for count in OPTION_COUNTS:
+        options = [f"preset {i}" for i in range(count)]
+        dropdown_options = json.dumps(options)
+        selected = options[-1]
+        kwargs = {f"option_{i}": i for i in range(count)}
+
+        assert baseline_index(selected, dropdown_options) == count - 1
+        assert map_dropdown.get_selected_index(selected, dropdown_options) == count - 1
+        assert node.map_dropdown(selected, dropdown_options, **kwargs) == (count - 1,)
+        pending = dict.fromkeys(kwargs)
+        assert node.check_lazy_status(selected, dropdown_options, **pending) == [f"option_{count - 1}"]
+
+        baseline = time_per_call(baseline_index, selected, dropdown_options)
+        lookup = time_per_call(map_dropdown.get_selected_index, selected, dropdown_options)
+        print(f"{count:>8} {baseline:>10.2f} {lookup:>10.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,7 @@
 # ComfyUI - CRZ Compare Node
+import operator as op
+import numpy as np
+import torch
 import nodes
 
 class AnyType(str):
@@ -7,6 +10,62 @@ class AnyType(str):
 
 any = AnyType("*")
 
+# Operator symbol -> function, works on plain values and elementwise on tensors
+OPERATORS = {
+    "=": op.eq,
+    "!=": op.ne,
+    ">": op.gt,
+    "<": op.lt,
+    ">=": op.ge,
+    "<=": op.le,
+}
+
+# How an elementwise result is reduced to one boolean
+REDUCTIONS = ["all", "any", "mean"]
+
+def is_array(value):
+    """True for tensors, ndarrays, latents and numeric lists/tuples, which are compared elementwise"""
+    if isinstance(value, dict):
+        return isinstance(value.get("samples"), torch.Tensor)
+    if isinstance(value, (list, tuple)):
+        # Other lists (e.g. of strings) keep plain equality
+        try:
+            return np.asarray(value).dtype.kind in "biuf"
+        except ValueError:
+            return False
+    return isinstance(value, (torch.Tensor, np.ndarray))
+
+def to_tensor(value):
+    """Convert an array-like (or a scalar to broadcast against one) to a tensor"""
+    if isinstance(value, dict):
+        value = value["samples"]
+    if isinstance(value, torch.Tensor):
+        return value
+    if isinstance(value, np.ndarray):
+        return torch.from_numpy(value)
+    if isinstance(value, (list, tuple)):
+        return torch.tensor(value)
+    return torch.tensor(float(value))
+
+def compare_tensors(a, b, operator, reduction, threshold, atol, rtol):
+    """Compare elementwise in one vectorized op, then reduce to a single boolean"""
+    a = to_tensor(a)
+    b = to_tensor(b).to(a.device)
+    if operator in ("=", "!=") and (atol > 0 or rtol > 0):
+        dtype = torch.promote_types(torch.promote_types(a.dtype, b.dtype), torch.float32)
+        mask = torch.isclose(a.to(dtype), b.to(dtype), rtol=rtol, atol=atol)
+        if operator == "!=":
+            mask = ~mask
+    else:
+        mask = OPERATORS.get(operator, op.eq)(a, b)
+
+    if reduction == "any":
+        return bool(mask.any())
+    if reduction == "mean":
+        # Fraction of matching elements
+        return bool(mask.float().mean() >= threshold)
+    return bool(mask.all())
+
 class CRZCompare:
     @classmethod
     def INPUT_TYPES(s):
@@ -15,7 +74,12 @@ class CRZCompare:
                 "a": (any, {"default": 0}),
                 "b": (any, {"default": 0}),
             },
-            "optional": {},
+            "optional": {
+                "reduction": (REDUCTIONS, {"default": "all"}),
+                "threshold": ("FLOAT", {"default": 0.5, "min": 0.0, "max": 1.0, "step": 0.01}),
+                "atol": ("FLOAT", {"default": 0.0, "min": 0.0, "max": 1e9, "step": 0.0001}),
+                "rtol": ("FLOAT", {"default": 0.0, "min": 0.0, "max": 1e9, "step": 0.0001}),
+            },
             "hidden": {
                 "operator": ("STRING", {"default": "="})
             }
@@ -26,59 +90,39 @@ class CRZCompare:
     CATEGORY = 'CRZ'
     OUTPUT_NODE = False
 
-    def compare(self, a, b, operator="="):
+    def compare(self, a, b, operator="=", reduction="all", threshold=0.5, atol=0.0, rtol=0.0):
         """
         Compare two values using specified operator and return boolean result
-        Supports =, >, <, >=, <= operators
+        Supports =, !=, >, <, >=, <= operators
+        Tensors, ndarrays, latents and lists are compared elementwise and reduced with
+        reduction (all, any, or mean: at least threshold of the elements match)
+        atol/rtol make = and != tolerant, for both numbers and tensors
         """
         try:
-            if operator == ">":
-                # Convert to numbers for greater than comparison
-                try:
-                    result = (float(a) > float(b))
-                    return (result,)
-                except (ValueError, TypeError):
-                    # If can't convert to numbers, fall back to string comparison
-                    result = (str(a) > str(b))
-                    return (result,)
-                    
-            elif operator == "<":
-                # Convert to numbers for less than comparison
-                try:
-                    result = (float(a) < float(b))
-                    return (result,)
-                except (ValueError, TypeError):
-                    # If can't convert to numbers, fall back to string comparison
-                    result = (str(a) < str(b))
-                    return (result,)
-                    
-            elif operator == ">=":
-                # Convert to numbers for greater than or equal comparison
-                try:
-                    result = (float(a) >= float(b))
-                    return (result,)
-                except (ValueError, TypeError):
-                    # If can't convert to numbers, fall back to string comparison
-                    result = (str(a) >= str(b))
-                    return (result,)
-                    
-            elif operator == "<=":
-                # Convert to numbers for less than or equal comparison
-                try:
-                    result = (float(a) <= float(b))
-                    return (result,)
-                except (ValueError, TypeError):
-                    # If can't convert to numbers, fall back to string comparison
-                    result = (str(a) <= str(b))
-                    return (result,)
-                    
-            else:  # operator == "=" or default
-                # Try direct equality comparison first
-                result = (a == b)
-                return (result,)
-                
-        except Exception:
+            if is_array(a) or is_array(b):
+                return (compare_tensors(a, b, operator, reduction, threshold, atol, rtol),)
+
+            if operator in ("=", "!=") or operator not in OPERATORS:
+                equal = (a == b)
+                if not equal and (atol > 0 or rtol > 0):
+                    try:
+                        # Same rule as torch.isclose
+                        equal = abs(float(a) - float(b)) <= atol + rtol * abs(float(b))
+                    except (ValueError, TypeError):
+                        pass
+                return ((not equal) if operator == "!=" else equal,)
+
+            fn = OPERATORS[operator]
+            try:
+                # Convert to numbers for ordering comparisons
+                return (fn(float(a), float(b)),)
+            except (ValueError, TypeError):
+                # If can't convert to numbers, fall back to string comparison
+                return (fn(str(a), str(b)),)
+
+        except Exception as e:
             # If all else fails, return False
+            print(f"CRZ Compare: could not compare {type(a).__name__} and {type(b).__name__}: {e}")
             return (False,)
 
 NODE_CLASS_MAPPINGS = {
@@ -1,5 +1,7 @@
 # ComfyUI - Uber CRZ Dashboard Node
 import nodes
+from server import PromptServer
+from .dashboard_registry import dashboard_registry
 
 class AnyType(str):
     def __ne__(self, __value: object) -> bool:
@@ -13,6 +15,24 @@ SLIDER_MIN = 0.0
 SLIDER_MAX = 1000000.0
 SLIDER_STEP = 0.01
 
+def smart_convert(value):
+    """Convert inputs to proper types based on their values"""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        # String inputs (like ComboBox values) pass through unchanged
+        return value
+    if isinstance(value, float):
+        # Only convert to boolean if it's exactly 0.0 or 1.0 AND looks like a toggle
+        # For now, let's be more conservative and just convert whole numbers to integers
+        if value == float(int(value)):
+            return int(value)
+        else:
+            return value
+    return value
+
 class CRZDashboardNode:
     @classmethod
     def INPUT_TYPES(s):
@@ -20,6 +40,8 @@ class CRZDashboardNode:
             "required": {},
             "hidden": {
                 "slider": ("FLOAT", {"default": 0.0}),
+                "slider_name": ("STRING", {"default": ""}),
+                "unique_id": "UNIQUE_ID",
             }
         }
 
@@ -29,54 +51,81 @@ class CRZDashboardNode:
     OUTPUT_NODE = True
 
     def main(self, **kwargs):
-        
-        # Convert inputs to proper types based on their values
-        def smart_convert(value):
-            if isinstance(value, bool):
-                return value
-            if isinstance(value, int):
-                return value
-            if isinstance(value, str):
-                # String inputs (like ComboBox values) pass through unchanged
-                return value
-            if isinstance(value, float):
-                # Only convert to boolean if it's exactly 0.0 or 1.0 AND looks like a toggle
-                # For now, let's be more conservative and just convert whole numbers to integers
-                if value == float(int(value)):
-                    return int(value)
-                else:
-                    return value
-            return value
-        
         # Get the value from kwargs (hidden widget or default)
         slider = kwargs.get('slider', 0.0)
         # Convert the value
         slider = smart_convert(slider)
-        
+
         # Register value in the global registry for get nodes
-        try:
-            from .dashboard_get import register_dashboard_value
-            # Get the node ID from the execution context
-            import inspect
-            frame = inspect.currentframe()
-            while frame:
-                if 'unique_id' in frame.f_locals:
-                    node_id = frame.f_locals['unique_id']
-                    # Register the single slider value
-                    register_dashboard_value(node_id, 0, slider)
-                    break
-                frame = frame.f_back
-        except Exception as e:
-            # If registration fails, continue normally
-            pass
-        
+        unique_id = kwargs.get('unique_id')
+        if unique_id is not None:
+            dashboard_registry.set(unique_id, slider, kwargs.get('slider_name') or None)
+
         # Return the converted value
         return (slider,)
 
+class CRZDashboardGet:
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "name": ("STRING", {"default": "Dashboard Node"}),
+            },
+            "hidden": {
+                # Linked to the named Dashboard Node when the prompt is queued
+                "value": (any,),
+            }
+        }
+
+    RETURN_TYPES = (any,)
+    RETURN_NAMES = ("value",)
+    FUNCTION = "get"
+    CATEGORY = 'CRZ'
+
+    def get(self, name, **kwargs):
+        """
+        Read a dashboard value by slider name, without a wire.
+        A Dashboard Node with that name in the same workflow is linked in at queue time, so it
+        always runs first. Otherwise the last registered value is used (None if there is none).
+        """
+        if 'value' in kwargs:
+            return (kwargs['value'],)
+        return (dashboard_registry.get_by_name(name),)
+
+    @classmethod
+    def IS_CHANGED(s, name, **kwargs):
+        # Only matters for the registry fallback, a linked Dashboard Node invalidates us itself
+        return repr(dashboard_registry.get_by_name(name))
+
+def link_dashboard_get_nodes(json_data):
+    """Link every Dashboard Get node to the Dashboard Node with the same name in the prompt"""
+    prompt = json_data.get("prompt")
+    if not isinstance(prompt, dict):
+        return json_data
+
+    dashboard_ids = {}
+    for node_id, node in prompt.items():
+        if isinstance(node, dict) and node.get("class_type") == "CRZDashboardNode":
+            name = node.get("inputs", {}).get("slider_name")
+            if name:
+                dashboard_ids.setdefault(name, node_id)
+
+    for node in prompt.values():
+        if isinstance(node, dict) and node.get("class_type") == "CRZDashboardGet":
+            inputs = node.setdefault("inputs", {})
+            node_id = dashboard_ids.get(inputs.get("name"))
+            if node_id is not None:
+                inputs["value"] = [node_id, 0]
+    return json_data
+
+PromptServer.instance.add_on_prompt_handler(link_dashboard_get_nodes)
+
 NODE_CLASS_MAPPINGS = {
     "CRZDashboardNode": CRZDashboardNode,
+    "CRZDashboardGet": CRZDashboardGet,
 }
 
 NODE_DISPLAY_NAME_MAPPINGS = {
     "CRZDashboardNode": "CRZ Dashboard Node",
+    "CRZDashboardGet": "CRZ Dashboard Get",
 }
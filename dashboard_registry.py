@@ -0,0 +1,160 @@
+# ComfyUI - CRZ Dashboard Value Registry and prompt control helpers
+import threading
+
+class CRZDashboardRegistry:
+    """
+    Thread-safe in-process store of dashboard values, keyed by node id and by slider name.
+    Dashboard nodes write their value when they run, Dashboard Get nodes (and the server
+    routes) read them back in O(1).
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.values = {}
+        self.names = {}
+        self.node_names = {}
+        self.version = 0
+
+    def set(self, node_id, value, name=None):
+        """Store the value of a dashboard node, bumping the version only when something changed"""
+        node_id = str(node_id)
+        with self.lock:
+            changed = self.values.get(node_id, self) != value
+            if name and self.names.get(name) != node_id:
+                # A renamed node drops its old name
+                old_name = self.node_names.get(node_id)
+                if old_name is not None and self.names.get(old_name) == node_id:
+                    del self.names[old_name]
+                self.names[name] = node_id
+                self.node_names[node_id] = name
+                changed = True
+            if changed:
+                self.values[node_id] = value
+                self.version += 1
+            return changed
+
+    def set_many(self, values):
+        """
+        Write {node id or slider name: value} under one lock, returns (version, changed keys).
+        Unknown keys are stored as names, so Dashboard Get nodes can read them.
+        The version is bumped once per call, and not at all when nothing changed.
+        """
+        changed = []
+        with self.lock:
+            for key, value in values.items():
+                key = str(key)
+                node_id = key if key in self.values else self.names.get(key)
+                if node_id is None:
+                    node_id = key
+                    self.names[key] = key
+                    self.node_names[key] = key
+                if self.values.get(node_id, self) != value:
+                    self.values[node_id] = value
+                    changed.append(key)
+            if changed:
+                self.version += 1
+            return self.version, changed
+
+    def get(self, node_id, default=None):
+        """Value of a dashboard node by id"""
+        with self.lock:
+            return self.values.get(str(node_id), default)
+
+    def get_by_name(self, name, default=None):
+        """Value of a dashboard node by its slider name"""
+        with self.lock:
+            node_id = self.names.get(name)
+            return self.values.get(node_id, default) if node_id is not None else default
+
+    def snapshot(self):
+        """(version, {node_id: value}, {name: node_id}) copied under the lock"""
+        with self.lock:
+            return self.version, dict(self.values), dict(self.names)
+
+    def clear(self):
+        with self.lock:
+            self.values.clear()
+            self.names.clear()
+            self.node_names.clear()
+            self.version += 1
+
+# CRZ control node class -> the prompt input holding its value
+CONTROL_INPUTS = {
+    "CRZBooleanToggle": "value",
+    "CRZFloatSlider": "value",
+    "CRZIntegerSlider": "value",
+    "CRZDropdown": "value",
+    "CRZCustomDropdown": "dropdown",
+    "CRZStringNode": "text",
+    "CRZDashboardNode": "slider",
+}
+
+def control_name(node):
+    """Display name of a control in an API format prompt: the slider name or the node title"""
+    name = node.get("inputs", {}).get("slider_name")
+    if not name:
+        name = node.get("_meta", {}).get("title")
+    return name
+
+def index_controls(prompt):
+    """
+    Map every CRZ control in a prompt to (node_id, input_name), keyed by node id and by name.
+    Node ids win over names, the first node with a name wins over later ones.
+    """
+    index = {}
+    by_name = {}
+    for node_id, node in prompt.items():
+        input_name = CONTROL_INPUTS.get(node.get("class_type")) if isinstance(node, dict) else None
+        if input_name is None:
+            continue
+        index[str(node_id)] = (str(node_id), input_name)
+        name = control_name(node)
+        if name:
+            by_name.setdefault(name, (str(node_id), input_name))
+    for name, target in by_name.items():
+        index.setdefault(name, target)
+    return index
+
+def read_controls(prompt):
+    """{node_id: {class_type, name, value}} for every CRZ control in a prompt"""
+    controls = {}
+    for node_id, node in prompt.items():
+        input_name = CONTROL_INPUTS.get(node.get("class_type")) if isinstance(node, dict) else None
+        if input_name is not None:
+            controls[str(node_id)] = {
+                "class_type": node["class_type"],
+                "name": control_name(node),
+                "value": node.get("inputs", {}).get(input_name),
+            }
+    return controls
+
+def apply_values(prompt, index, values):
+    """
+    Return (patched prompt, changed keys, unknown keys) for one set of {node id or name: value}.
+    The prompt is not modified, only the patched nodes are copied, and values that are already
+    set are skipped so a no-op variation returns the original prompt object.
+    """
+    patched = None
+    changed = []
+    unknown = []
+    for key, value in values.items():
+        target = index.get(str(key))
+        if target is None:
+            unknown.append(key)
+            continue
+        node_id, input_name = target
+        source = patched if patched is not None else prompt
+        inputs = source[node_id].get("inputs", {})
+        if input_name in inputs and inputs[input_name] == value:
+            continue
+        if patched is None:
+            patched = dict(prompt)
+        if patched[node_id] is prompt[node_id]:
+            node = dict(prompt[node_id])
+            node["inputs"] = dict(node.get("inputs", {}))
+            patched[node_id] = node
+        patched[node_id]["inputs"][input_name] = value
+        changed.append(key)
+    return (patched if patched is not None else prompt), changed, unknown
+
+# Global registry instance
+dashboard_registry = CRZDashboardRegistry()
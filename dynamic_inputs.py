@@ -0,0 +1,39 @@
+# ComfyUI - CRZ dynamic lazy inputs, shared by nodes with a growing list of sockets
+
+# This is a hack to work around ComfyUI's type validation system
+class AnyTypeStr(str):
+    def __eq__(self, __value: object) -> bool:
+        return True
+
+    def __ne__(self, __value: object) -> bool:
+        return False
+
+AnyType = AnyTypeStr("*")
+
+def is_dynamic_input(name, prefix):
+    """True for <prefix>N input names, e.g. option_3 for prefix "option_" """
+    return isinstance(name, str) and name.startswith(prefix) and name[len(prefix):].isdigit()
+
+class LazyDynamicInputs(dict):
+    """
+    Optional inputs that also accept any <prefix>N socket the frontend adds, each one lazy.
+    ComfyUI looks inputs up by name, so there is no fixed upper bound on the socket count.
+    """
+    def __init__(self, prefix, base):
+        super().__init__(base)
+        self.prefix = prefix
+
+    def __contains__(self, key):
+        return super().__contains__(key) or is_dynamic_input(key, self.prefix)
+
+    def __getitem__(self, key):
+        if not super().__contains__(key) and is_dynamic_input(key, self.prefix):
+            return (AnyType, {"lazy": True})
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+def lazy_dynamic_inputs(prefix, base):
+    """Optional inputs dict of base plus any number of lazy <prefix>N sockets"""
+    return LazyDynamicInputs(prefix, base)
@@ -1,4 +1,15 @@
 # ComfyUI - CRZ Execute Block
+
+try:
+    from comfy_execution.graph import ExecutionBlocker
+except ImportError:
+    # Fallback if ExecutionBlocker is not available, blocked outputs become None
+    ExecutionBlocker = None
+
+def blocked_output():
+    """Output value that stops downstream nodes from running"""
+    return ExecutionBlocker(None) if ExecutionBlocker is not None else None
+
 class AnyType(str):
     def __ne__(self, __value: object) -> bool:
         return False
@@ -10,7 +21,7 @@ class CRZExecuteBlock:
     def INPUT_TYPES(s):
         return {
             "required": {
-                "input": (any_type, {"default": None}),
+                "input": (any_type, {"default": None, "lazy": True}),
                 "bool": ("BOOLEAN", {"default": False, "forceInput": False}),
             },
         }
@@ -21,27 +32,22 @@ class CRZExecuteBlock:
     CATEGORY = 'CRZ'
     OUTPUT_NODE = False
 
-    def execute(self, input, bool):
+    def check_lazy_status(self, input=None, bool=False):
+        # Only evaluate the upstream branch when it will be passed through
+        if bool and input is None:
+            return ["input"]
+        return []
+
+    def execute(self, bool, input=None):
         """
         Execute block - passes input through or blocks execution based on bool condition
         Uses ExecutionBlocker to prevent execution when bool is False
         """
-        try:
-            from comfy_execution.graph import ExecutionBlocker
-            
-            if bool:
-                # Allow execution - pass input through
-                return (input,)
-            else:
-                # Block execution
-                return (ExecutionBlocker(None),)
-                
-        except ImportError:
-            # Fallback if ExecutionBlocker is not available
-            if bool:
-                return (input,)
-            else:
-                return (None,)
+        if bool:
+            # Allow execution - pass input through
+            return (input,)
+        # Block execution
+        return (blocked_output(),)
 
 NODE_CLASS_MAPPINGS = {
     "CRZExecuteBlock": CRZExecuteBlock,
@@ -1,4 +1,8 @@
 # ComfyUI - CRZ Execute Switch
+from .switch import get_switch_index
+from .execute_block import blocked_output
+from .prompt_utils import output_is_linked
+
 class AnyType(str):
     def __ne__(self, __value: object) -> bool:
         return False
@@ -10,9 +14,13 @@ class CRZExecuteSwitch:
     def INPUT_TYPES(s):
         return {
             "required": {
-                "input": (any_type, {"default": None}),
+                "input": (any_type, {"default": None, "lazy": True}),
                 "bool": ("BOOLEAN", {"default": False, "forceInput": False}),
             },
+            "hidden": {
+                "prompt": "PROMPT",
+                "unique_id": "UNIQUE_ID",
+            },
         }
 
     RETURN_TYPES = (any_type, any_type)
@@ -21,32 +29,74 @@ class CRZExecuteSwitch:
     CATEGORY = 'CRZ'
     OUTPUT_NODE = False
 
-    def execute(self, input, bool):
+    def check_lazy_status(self, input=None, bool=False, prompt=None, unique_id=None):
+        # Only evaluate the upstream branch when the active output is actually connected
+        if input is None and output_is_linked(prompt, unique_id, 0 if bool else 1):
+            return ["input"]
+        return []
+
+    def execute(self, bool, input=None, prompt=None, unique_id=None):
         """
         Execute switch - routes input to true or false output based on bool condition
         Uses ExecutionBlocker to prevent execution on the inactive branch
         """
-        try:
-            from comfy_execution.graph import ExecutionBlocker
-            
-            if bool:
-                # Route to true output, block false output
-                return (input, ExecutionBlocker(None))
-            else:
-                # Route to false output, block true output  
-                return (ExecutionBlocker(None), input)
-                
-        except ImportError:
-            # Fallback if ExecutionBlocker is not available
-            if bool:
-                return (input, None)
-            else:
-                return (None, input)
+        if bool:
+            # Route to true output, block false output
+            return (input, blocked_output())
+        # Route to false output, block true output
+        return (blocked_output(), input)
+
+MAX_ROUTES = 8
+
+class CRZExecuteRouter:
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "input": (any_type, {"default": None, "lazy": True}),
+                "select": (any_type, {"default": 0}),  # INT index, BOOLEAN or dropdown string
+            },
+            "optional": {
+                "keys": ("STRING", {"default": ""}),
+            },
+            "hidden": {
+                "prompt": "PROMPT",
+                "unique_id": "UNIQUE_ID",
+            },
+        }
+
+    RETURN_TYPES = (any_type,) * MAX_ROUTES
+    RETURN_NAMES = tuple(f"output_{i}" for i in range(MAX_ROUTES))
+    FUNCTION = "execute"
+    CATEGORY = 'CRZ'
+    OUTPUT_NODE = False
+
+    def check_lazy_status(self, select=0, input=None, keys="", prompt=None, unique_id=None):
+        # Only evaluate the upstream branch when the selected output is actually connected
+        index = get_switch_index(select, keys)
+        if input is None and 0 <= index < MAX_ROUTES and output_is_linked(prompt, unique_id, index):
+            return ["input"]
+        return []
+
+    def execute(self, select=0, input=None, keys="", prompt=None, unique_id=None):
+        """
+        Execute router - forwards input to the selected output and blocks all the others
+        select works like the Index Switch: an int, a boolean, or a dropdown value looked up in keys
+        """
+        index = get_switch_index(select, keys)
+        return tuple(input if i == index else blocked_output() for i in range(MAX_ROUTES))
+
+    @classmethod
+    def VALIDATE_INPUTS(s, select=None, **kwargs):
+        # Accept any type for the selector
+        return True
 
 NODE_CLASS_MAPPINGS = {
     "CRZExecuteSwitch": CRZExecuteSwitch,
+    "CRZExecuteRouter": CRZExecuteRouter,
 }
 
 NODE_DISPLAY_NAME_MAPPINGS = {
     "CRZExecuteSwitch": "CRZ Execute Switch",
+    "CRZExecuteRouter": "CRZ Execute Router",
 }
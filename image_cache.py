@@ -0,0 +1,227 @@
+# ComfyUI - CRZ Image Cache
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import torch
+import folder_paths
+from .preferences import preferences
+
+
+class CRZImageCache:
+    """In-process LRU cache of decoded image tensors with a byte budget"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evicted_bytes = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def make_key(full_path):
+        """Build a cache key from path, mtime and size, or None if the file is missing"""
+        try:
+            stat = os.stat(full_path)
+        except OSError:
+            return None
+        return (os.path.abspath(full_path), stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def entry_size(value):
+        """Size in bytes of a cached tensor or tuple of tensors"""
+        if isinstance(value, tuple):
+            return sum(v.element_size() * v.nelement() for v in value if v is not None)
+        return value.element_size() * value.nelement()
+
+    def get(self, key):
+        """Return the cached value for key (marking it recently used) or None"""
+        with self.lock:
+            value = self.entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def contains(self, key):
+        """Check for key without touching the LRU order or the counters"""
+        with self.lock:
+            return key in self.entries
+
+    def put(self, key, value):
+        """Store a value, evicting least recently used entries to stay within budget"""
+        size = self.entry_size(value)
+        with self.lock:
+            if size > self.max_bytes:
+                # Never cache something that would flush the whole cache on its own
+                return
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= self.entry_size(old)
+            self.entries[key] = value
+            self.current_bytes += size
+            self._evict()
+
+    def stats(self):
+        """Snapshot of the cache counters, served at /crz/cache/stats"""
+        with self.lock:
+            return {
+                "entries": len(self.entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evicted_bytes": self.evicted_bytes,
+            }
+
+    def _evict(self):
+        # Caller must hold the lock
+        while self.current_bytes > self.max_bytes and self.entries:
+            _, value = self.entries.popitem(last=False)
+            size = self.entry_size(value)
+            self.current_bytes -= size
+            self.evicted_bytes += size
+
+
+class CRZDiskTensorCache:
+    """
+    On-disk cache of decoded tensors stored as .npy files, loaded back with mmap so warm
+    starts map the data instead of decoding it. Least recently used entries are removed
+    once the directory grows past max_bytes.
+    An entry is a tuple of tensors (or None), each stored as <hash>.<index>.npy. Part 0 is
+    written last and marks the entry complete; eviction always removes whole entries.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        # Writes happen off the decode path, one at a time
+        self.writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="crz_disk_cache")
+
+    @property
+    def enabled(self):
+        return self.max_bytes > 0
+
+    def paths_for(self, key, count):
+        name = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        directory = get_cache_directory("tensors")
+        return [os.path.join(directory, f"{name}.{index}.npy") for index in range(count)]
+
+    def get(self, key, count=1):
+        """Map the cached tuple of count tensors for key, or return None"""
+        if not self.enabled:
+            return None
+        paths = self.paths_for(key, count)
+        if not os.path.exists(paths[0]):
+            return None
+        values = []
+        try:
+            for path in paths:
+                if not os.path.exists(path):
+                    values.append(None)
+                    continue
+                # Copy-on-write mapping keeps the tensor writable without touching the file
+                values.append(torch.from_numpy(np.load(path, mmap_mode="c")))
+                os.utime(path)
+            return tuple(values)
+        except Exception as e:
+            print(f"CRZ disk cache: dropping unreadable entry {paths[0]}: {e}")
+            for path in paths:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            return None
+
+    def put(self, key, values):
+        """Write a tuple of tensors (or None) to the cache in the background"""
+        if not self.enabled:
+            return
+        arrays = [None if value is None else value.numpy() for value in values]
+        self.writer.submit(self._write, self.paths_for(key, len(arrays)), arrays)
+
+    def _write(self, paths, arrays):
+        # Part 0 goes last so a half-written entry is never picked up
+        for path, array in reversed(list(zip(paths, arrays))):
+            if array is None:
+                continue
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    np.save(f, array)
+                os.replace(tmp_path, path)
+            except Exception as e:
+                print(f"CRZ disk cache: failed to write {path}: {e}")
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                return
+        self.cleanup()
+
+    def cleanup(self):
+        """Remove least recently used entries until the cache fits its size cap"""
+        with self.lock:
+            directory = get_cache_directory("tensors")
+            entries = {}
+            for entry in os.scandir(directory):
+                if entry.name.endswith(".npy"):
+                    stat = entry.stat()
+                    name = entry.name.split(".", 1)[0]
+                    mtime, size, paths = entries.get(name, (0, 0, []))
+                    entries[name] = (max(mtime, stat.st_mtime), size + stat.st_size, paths + [entry.path])
+            total = sum(size for _, size, _ in entries.values())
+            for _, size, paths in sorted(entries.values()):
+                if total <= self.max_bytes:
+                    break
+                for path in paths:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                total -= size
+
+
+def get_cache_directory(*parts):
+    """CRZ cache directory next to the input folder, created on demand"""
+    input_dir = os.path.abspath(folder_paths.get_input_directory())
+    directory = os.path.join(os.path.dirname(input_dir), "crz_cache", *parts)
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+def file_fingerprint(full_path, content=False):
+    """
+    Fingerprint a file on disk.
+    By default this is the cheap mtime/size pair; with content=True the file bytes are hashed
+    so in-place rewrites that keep the same size and timestamp are still detected.
+    Returns an empty string if the file is missing.
+    """
+    try:
+        stat = os.stat(full_path)
+    except OSError:
+        return ""
+    if not content:
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
+    digest = hashlib.sha256()
+    try:
+        with open(full_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+    except OSError:
+        return ""
+    return digest.hexdigest()
+
+
+# Global decoded image cache, budget comes from preferences (in MB)
+image_cache = CRZImageCache(int(preferences.get("image_selector_cache_mb")) * 1024 * 1024)
+
+# Persistent tensor cache, disabled unless image_selector_disk_cache_mb is set
+disk_cache = CRZDiskTensorCache(int(preferences.get("image_selector_disk_cache_mb")) * 1024 * 1024)
@@ -0,0 +1,70 @@
+# ComfyUI - CRZ Image Decode helpers
+import numpy as np
+import torch
+from PIL import Image, ImageOps
+
+EXIF_ORIENTATION = 0x0112
+
+def open_image(full_path, draft_size=None):
+    """
+    Open an image and apply its EXIF orientation.
+    If draft_size (width, height) is given, JPEGs are decoded with PIL's draft mode at the
+    smallest power-of-two reduction that is still at least that size.
+    """
+    i = Image.open(full_path)
+    orientation = i.getexif().get(EXIF_ORIENTATION, 1)
+
+    if draft_size is not None and i.format == "JPEG":
+        width, height = draft_size
+        if orientation in (5, 6, 7, 8):
+            # Image is stored rotated by 90 degrees
+            width, height = height, width
+        i.draft("RGB", (width, height))
+
+    # Orientation 1 is the identity, skip the transpose pass entirely
+    if orientation != 1:
+        i = ImageOps.exif_transpose(i)
+    return i
+
+def convert_image(image, dtype=torch.float32, out=None):
+    """
+    Convert a uint8 (0..255) or float (0..1) image tensor to a float dtype.
+    uint8 data is converted and scaled in place inside a single buffer, which can be
+    passed in as out (e.g. a row of a preallocated batch).
+    """
+    if out is None:
+        if image.dtype == dtype:
+            return image
+        out = torch.empty(image.shape, dtype=dtype)
+    out.copy_(image)
+    if image.dtype == torch.uint8:
+        out.div_(255.0)
+    return out
+
+def decode_image_and_mask(full_path, draft_size=None, dtype=torch.float32):
+    """
+    Decode an image file to a (1, H, W, 3) image tensor and, if it has transparency,
+    a (1, H, W) mask (1 where transparent, like LoadImage), otherwise None.
+    dtype=torch.uint8 keeps raw 0..255 values, float dtypes are scaled to 0..1.
+    Both come out of the same decode.
+    """
+    i = open_image(full_path, draft_size)
+    if i.mode == "P" and "transparency" in i.info:
+        i = i.convert("RGBA")
+
+    alpha = None
+    if "A" in i.getbands():
+        alpha = torch.from_numpy(np.array(i.getchannel("A"), dtype=np.uint8))[None,]
+    image = i if i.mode == "RGB" else i.convert("RGB")
+    pixels = torch.from_numpy(np.array(image, dtype=np.uint8))[None,]
+
+    mask = None
+    if alpha is not None:
+        mask = 255 - alpha
+    if dtype == torch.uint8:
+        return pixels, mask
+    return convert_image(pixels, dtype), None if mask is None else convert_image(mask, dtype)
+
+def decode_image(full_path, draft_size=None, dtype=torch.float32):
+    """Decode an image file to a (1, H, W, 3) tensor"""
+    return decode_image_and_mask(full_path, draft_size, dtype)[0]
@@ -0,0 +1,191 @@
+# ComfyUI - CRZ Image Folder
+import os
+import glob
+import hashlib
+import threading
+from functools import partial
+import folder_paths
+from .image_selector import load_image_file, make_image_batch, get_decode_pool
+
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp", ".bmp", ".gif", ".tif", ".tiff"}
+
+# Outstanding background prefetches, cancelled whenever a new window is requested
+_prefetch_futures = []
+_prefetch_lock = threading.Lock()
+
+def list_folder_images(pattern, sort_by="name", descending=False, start=0, limit=0):
+    """
+    Resolve a folder or glob (relative to the input directory) to a sorted list of image paths.
+    Returned paths are relative to the input directory, the same form the Image Selector slots use.
+    """
+    input_dir = os.path.abspath(folder_paths.get_input_directory())
+    pattern = (pattern or "").strip()
+    if os.path.isdir(os.path.join(input_dir, pattern)):
+        pattern = os.path.join(pattern, "*")
+
+    matches = []
+    # Escaped input dir joined into the pattern rather than glob's root_dir, which needs Python 3.10
+    for match in glob.glob(os.path.join(glob.escape(input_dir), pattern), recursive=True):
+        full_path = os.path.abspath(match)
+        # Never leave the input directory
+        if os.path.commonpath([input_dir, full_path]) != input_dir:
+            continue
+        path = os.path.relpath(full_path, input_dir)
+        if os.path.splitext(path)[1].lower() in IMAGE_EXTENSIONS and os.path.isfile(full_path):
+            matches.append(path)
+
+    if sort_by == "mtime":
+        matches.sort(key=lambda p: (os.path.getmtime(os.path.join(input_dir, p)), p), reverse=descending)
+    elif sort_by == "size":
+        matches.sort(key=lambda p: (os.path.getsize(os.path.join(input_dir, p)), p), reverse=descending)
+    else:
+        matches.sort(reverse=descending)
+
+    matches = matches[max(0, start):]
+    if limit > 0:
+        matches = matches[:limit]
+    return matches
+
+def decode_paths(paths, draft_size=None):
+    """Decode a chunk of images on the shared decode pool"""
+    load = partial(load_image_file, draft_size=draft_size)
+    pool = get_decode_pool()
+    if pool is None:
+        return [load(path)[0] for path in paths]
+    return [image for image, _ in pool.map(load, paths)]
+
+def prefetch(paths, draft_size=None):
+    """Warm the image cache for upcoming files without blocking, replacing any earlier window"""
+    pool = get_decode_pool()
+    with _prefetch_lock:
+        for future in _prefetch_futures:
+            future.cancel()
+        _prefetch_futures.clear()
+        if pool is None:
+            return
+        for path in paths:
+            _prefetch_futures.append(pool.submit(load_image_file, path, draft_size))
+
+class CRZImageFolderBatch:
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "pattern": ("STRING", {"default": ""}),
+                "sort_by": (["name", "mtime", "size"], {"default": "name"}),
+                "descending": ("BOOLEAN", {"default": False}),
+                "start": ("INT", {"default": 0, "min": 0, "max": 0xffffffff}),
+                "limit": ("INT", {"default": 0, "min": 0, "max": 0xffffffff}),
+                "chunk_size": ("INT", {"default": 16, "min": 1, "max": 4096}),
+                "chunk_index": ("INT", {"default": 0, "min": 0, "max": 0xffffffff}),
+                "prefetch_chunks": ("INT", {"default": 1, "min": 0, "max": 16}),
+            },
+            "optional": {
+                "batch_size_mode": (["first", "largest", "smallest", "fixed"], {"default": "first"}),
+                "batch_width": ("INT", {"default": 512, "min": 16, "max": 16384, "step": 8}),
+                "batch_height": ("INT", {"default": 512, "min": 16, "max": 16384, "step": 8}),
+                "resize_filter": (["lanczos", "bicubic", "bilinear", "area", "nearest-exact"], {"default": "lanczos"}),
+                "fast_decode": ("BOOLEAN", {"default": False}),
+            }
+        }
+
+    RETURN_TYPES = ("IMAGE", "INT", "INT", "INT", "STRING")
+    RETURN_NAMES = ("image_batch", "image_count", "total_count", "chunk_count", "filenames")
+    FUNCTION = "load_chunk"
+    CATEGORY = "CRZ"
+
+    def load_chunk(self, pattern, sort_by, descending, start, limit, chunk_size, chunk_index, prefetch_chunks,
+                   batch_size_mode="first", batch_width=512, batch_height=512, resize_filter="lanczos",
+                   fast_decode=False):
+        """
+        Load one fixed-size chunk of the matching files as a batch.
+        Only the requested chunk is decoded, the next prefetch_chunks chunks are warmed in the
+        background so stepping chunk_index keeps memory flat however many files match.
+        """
+        paths = list_folder_images(pattern, sort_by, descending, start, limit)
+        chunk_count = (len(paths) + chunk_size - 1) // chunk_size
+        offset = chunk_index * chunk_size
+        chunk_paths = paths[offset:offset + chunk_size]
+
+        draft_size = (batch_width, batch_height) if fast_decode and batch_size_mode == "fixed" else None
+        images = decode_paths(chunk_paths, draft_size)
+        prefetch(paths[offset + chunk_size:offset + chunk_size * (1 + prefetch_chunks)], draft_size)
+
+        image_batch, _ = make_image_batch(images, batch_size_mode, batch_width, batch_height, resize_filter)
+        return (image_batch, len(chunk_paths), len(paths), chunk_count, "\n".join(chunk_paths))
+
+    @classmethod
+    def IS_CHANGED(s, pattern, sort_by, descending, start, limit, chunk_size, chunk_index, prefetch_chunks, **kwargs):
+        return folder_fingerprint(pattern, sort_by, descending, start, limit, chunk_size, chunk_index)
+
+class CRZImageFolderList:
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "pattern": ("STRING", {"default": ""}),
+                "sort_by": (["name", "mtime", "size"], {"default": "name"}),
+                "descending": ("BOOLEAN", {"default": False}),
+                "start": ("INT", {"default": 0, "min": 0, "max": 0xffffffff}),
+                "limit": ("INT", {"default": 0, "min": 0, "max": 0xffffffff}),
+                "chunk_size": ("INT", {"default": 16, "min": 1, "max": 4096}),
+                "prefetch_chunks": ("INT", {"default": 1, "min": 0, "max": 16}),
+            },
+        }
+
+    RETURN_TYPES = ("IMAGE", "STRING", "INT")
+    RETURN_NAMES = ("images", "filenames", "total_count")
+    OUTPUT_IS_LIST = (True, True, False)
+    FUNCTION = "load_list"
+    CATEGORY = "CRZ"
+
+    def load_list(self, pattern, sort_by, descending, start, limit, chunk_size, prefetch_chunks):
+        """
+        Load the matching files as an output list, decoding chunk by chunk.
+        At most prefetch_chunks chunks are decoding ahead of the one being collected.
+        """
+        paths = list_folder_images(pattern, sort_by, descending, start, limit)
+        pool = get_decode_pool()
+        if pool is None:
+            return ([load_image_file(path)[0] for path in paths], paths, len(paths))
+
+        chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+        pending = [[pool.submit(load_image_file, path) for path in chunk] for chunk in chunks[:1 + prefetch_chunks]]
+        images = []
+        for index in range(len(chunks)):
+            futures = pending.pop(0)
+            upcoming = index + 1 + prefetch_chunks
+            if upcoming < len(chunks):
+                pending.append([pool.submit(load_image_file, path) for path in chunks[upcoming]])
+            images.extend(future.result()[0] for future in futures)
+        return (images, paths, len(paths))
+
+    @classmethod
+    def IS_CHANGED(s, pattern, sort_by, descending, start, limit, chunk_size, prefetch_chunks, **kwargs):
+        return folder_fingerprint(pattern, sort_by, descending, start, limit)
+
+def folder_fingerprint(pattern, sort_by, descending, start, limit, chunk_size=0, chunk_index=0):
+    """Fingerprint the matched files (name, mtime, size) so new or edited files re-run the node"""
+    input_dir = folder_paths.get_input_directory()
+    paths = list_folder_images(pattern, sort_by, descending, start, limit)
+    m = hashlib.sha256()
+    m.update(f"{len(paths)}\0".encode("utf-8"))
+    if chunk_size > 0:
+        paths = paths[chunk_index * chunk_size:(chunk_index + 1) * chunk_size]
+    for path in paths:
+        try:
+            stat = os.stat(os.path.join(input_dir, path))
+            m.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}\0".encode("utf-8"))
+        except OSError:
+            m.update(f"{path}:missing\0".encode("utf-8"))
+    return m.hexdigest()
+
+NODE_CLASS_MAPPINGS = {
+    "CRZImageFolderBatch": CRZImageFolderBatch,
+    "CRZImageFolderList": CRZImageFolderList,
+}
+
+NODE_DISPLAY_NAME_MAPPINGS = {
+    "CRZImageFolderBatch": "CRZ Image Folder (Chunked Batch)",
+    "CRZImageFolderList": "CRZ Image Folder (List)",
+}
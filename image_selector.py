@@ -1,11 +1,275 @@
 # ComfyUI - CRZ Image Selector
 import os
+import time
+import uuid
 import hashlib
-from PIL import Image, ImageOps
-import numpy as np
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import torch
-from pathlib import Path
 import folder_paths
+from server import PromptServer
+from .image_cache import image_cache, disk_cache, file_fingerprint
+from .image_decode import decode_image_and_mask, convert_image
+from .preferences import preferences
+from .prompt_utils import output_is_linked
+
+# Shared decode pool, rebuilt only when the worker count preference changes
+_decode_pool = None
+_decode_pool_workers = 0
+_decode_pool_lock = threading.Lock()
+
+def get_decode_pool():
+    """Return the shared decode thread pool, or None when decoding should run serially"""
+    global _decode_pool, _decode_pool_workers
+    workers = int(preferences.get("image_selector_decode_workers") or 0)
+    if workers <= 1:
+        return None
+    with _decode_pool_lock:
+        if _decode_pool is None or _decode_pool_workers != workers:
+            if _decode_pool is not None:
+                _decode_pool.shutdown(wait=False)
+            _decode_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="crz_decode")
+            _decode_pool_workers = workers
+        return _decode_pool
+
+def load_image_file(image_path, draft_size=None, dtype=torch.float32, use_prefetch=True):
+    """
+    Load a single image from the input directory and return (image, mask).
+    mask is None when the file has no transparency.
+    draft_size (width, height) enables the reduced-resolution JPEG decode path.
+    dtype=torch.uint8 keeps the decoded pixels (and their cache entries) as raw uint8.
+    use_prefetch waits for a matching prompt-submission prefetch instead of decoding twice.
+    """
+    if not image_path or image_path == "":
+        # Return a blank 64x64 black image if no path provided
+        blank_image = torch.zeros((1, 64, 64, 3), dtype=torch.float32)
+        return blank_image, None
+    
+    try:
+        input_dir = folder_paths.get_input_directory()
+        full_path = os.path.join(input_dir, image_path)
+        
+        cache_key = image_cache.make_key(full_path)
+        if cache_key is None:
+            # Return blank image if file doesn't exist
+            blank_image = torch.zeros((1, 64, 64, 3), dtype=torch.float32)
+            return blank_image, None
+        cache_key += (draft_size, str(dtype))
+
+        # Reuse the decoded tensor if this exact file version was loaded before
+        cached = image_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Pick up a prefetch of this file that is already decoding, or take over a queued one
+        pending = None
+        if use_prefetch:
+            with _prefetch_lock:
+                pending = _prefetch_pending.pop(cache_key, None)
+        if pending is not None and not pending.cancel():
+            loaded = pending.result()
+            if loaded is not None:
+                return loaded
+
+        # Then the persistent cache, which maps the tensors instead of decoding them
+        loaded = disk_cache.get(cache_key, 2)
+        if loaded is None:
+            # Image and alpha mask come out of the same decode
+            loaded = decode_image_and_mask(full_path, draft_size, dtype)
+            disk_cache.put(cache_key, loaded)
+
+        image_cache.put(cache_key, loaded)
+        return loaded
+    except Exception as e:
+        print(f"Error loading image {image_path}: {e}")
+        # Return blank image on error
+        blank_image = torch.zeros((1, 64, 64, 3), dtype=torch.float32)
+        return blank_image, None
+
+# Prompt-submission prefetch: cache key -> Future of a background load_image_file
+_prefetch_pending = {}
+_prefetch_lock = threading.Lock()
+PREFETCH_GRACE_SECONDS = 5.0
+
+def slot_draft_sizes(draft_size, prompt=None, unique_id=None):
+    """
+    Per-slot draft sizes: the draft only applies to the batch rows, so slots whose own
+    image_N or mask_N output is wired are decoded at full resolution.
+    """
+    if draft_size is None:
+        return [None] * 6
+    return [None if output_is_linked(prompt, unique_id, slot) or output_is_linked(prompt, unique_id, 8 + slot)
+            else draft_size for slot in range(6)]
+
+def prompt_is_live(prompt_id, submitted, seen):
+    """
+    True while a submitted prompt is still queued or running, matched on its prompt id
+    (the queue keeps a deep copy of running prompts, so not the prompt object itself).
+    Until it first shows up in the queue (validation runs after on_prompt handlers)
+    it is given a short grace period.
+    """
+    try:
+        queue = PromptServer.instance.prompt_queue
+        with queue.mutex:
+            items = list(queue.queue) + list(queue.currently_running.values())
+    except Exception:
+        return True
+    if any(item[1] == prompt_id for item in items):
+        seen[0] = True
+        return True
+    return not seen[0] and time.monotonic() - submitted < PREFETCH_GRACE_SECONDS
+
+def prefetch_image_file(cache_key, image_path, draft_size, dtype, prompt_id, submitted, seen):
+    """Background prefetch job, skipped if the prompt was dropped before it got to run"""
+    try:
+        if not prompt_is_live(prompt_id, submitted, seen):
+            return None
+        return load_image_file(image_path, draft_size, dtype, use_prefetch=False)
+    finally:
+        with _prefetch_lock:
+            _prefetch_pending.pop(cache_key, None)
+
+def prefetch_prompt(json_data):
+    """
+    on_prompt handler: start decoding the files of every CRZImageSelector in a queued prompt,
+    so the node finds them in the image cache when it runs.
+    """
+    limit = int(preferences.get("image_selector_prefetch_max") or 0)
+    pool = get_decode_pool()
+    prompt = json_data.get("prompt") if isinstance(json_data, dict) else None
+    if limit <= 0 or pool is None or not isinstance(prompt, dict):
+        return json_data
+
+    # Tag the submission, ComfyUI keeps a prompt_id it is given instead of generating one
+    if not json_data.get("prompt_id"):
+        json_data["prompt_id"] = str(uuid.uuid4())
+    prompt_id = str(json_data["prompt_id"])
+
+    input_dir = folder_paths.get_input_directory()
+    submitted = time.monotonic()
+    seen = [False]
+    for node_id, node in prompt.items():
+        if not isinstance(node, dict) or node.get("class_type") != "CRZImageSelector":
+            continue
+        inputs = node.get("inputs", {})
+        draft_size, dtype = CRZImageSelector.load_params(**{
+            k: v for k, v in inputs.items()
+            if k in ("batch_size_mode", "batch_width", "batch_height", "fast_decode", "output_dtype", "keep_uint8")
+            and not isinstance(v, list)
+        })
+        draft_sizes = slot_draft_sizes(draft_size, prompt, node_id)
+        for n in range(1, 7):
+            image_path = inputs.get(f"image_{n}")
+            if not isinstance(image_path, str) or not image_path:
+                continue
+            cache_key = image_cache.make_key(os.path.join(input_dir, image_path))
+            if cache_key is None:
+                continue
+            cache_key += (draft_sizes[n - 1], str(dtype))
+            with _prefetch_lock:
+                # Bounded: never more than limit files waiting, and never the same file twice
+                if cache_key in _prefetch_pending or len(_prefetch_pending) >= limit:
+                    continue
+                if image_cache.contains(cache_key):
+                    continue
+                _prefetch_pending[cache_key] = pool.submit(
+                    prefetch_image_file, cache_key, image_path, draft_sizes[n - 1], dtype, prompt_id, submitted, seen)
+    return json_data
+
+def batch_target_size(images, batch_size_mode, batch_width, batch_height):
+    """Pick the (height, width) every image in the batch is resized to"""
+    if batch_size_mode == "fixed":
+        return (batch_height, batch_width)
+    sizes = [tuple(image.shape[1:3]) for image in images]
+    if batch_size_mode == "largest":
+        return max(sizes, key=lambda size: size[0] * size[1])
+    if batch_size_mode == "smallest":
+        return min(sizes, key=lambda size: size[0] * size[1])
+    return sizes[0]
+
+def make_image_batch(images, batch_size_mode="first", batch_width=512, batch_height=512, resize_filter="lanczos",
+                     dtype=torch.float32):
+    """
+    Build a batch of the given float dtype from a list of image tensors (uint8 or float).
+    Returns (image_batch, images) where images that already match the batch size are
+    replaced by views into the batch storage, and the rest are converted to dtype.
+    """
+    images = list(images)
+
+    # Create batch similar to MakeImageBatch logic
+    if len(images) == 0:
+        # Return a blank 64x64 black image if no images
+        return torch.zeros((1, 64, 64, 3), dtype=dtype), images
+    if len(images) == 1 and batch_size_mode != "fixed":
+        images[0] = convert_image(images[0], dtype)
+        return images[0], images
+
+    first = images[0]
+    height, width = batch_target_size(images, batch_size_mode, batch_width, batch_height)
+    channels = first.shape[3]
+
+    # Preallocate the batch once and write every image straight into its row
+    image_batch = torch.empty((len(images), height, width, channels), dtype=dtype)
+
+    # Group mismatched images by source shape so each group is resized in one call
+    mismatched = {}
+    for row, image in enumerate(images):
+        if image.shape[1:3] != (height, width):
+            mismatched.setdefault(tuple(image.shape[1:]), []).append(row)
+        else:
+            # Same-sized images are converted straight into their row and returned as views
+            images[row] = convert_image(image, dtype, out=image_batch[row:row + 1])
+
+    if mismatched:
+        # The individual images keep their own size, only the batch rows are resized
+        import comfy.utils
+        for rows in mismatched.values():
+            for row in rows:
+                images[row] = convert_image(images[row], dtype)
+            group = [images[row] for row in rows]
+            group = group[0] if len(group) == 1 else torch.cat(group, dim=0)
+            # Resample in float32, the batch row cast happens on assignment
+            resized = comfy.utils.common_upscale(
+                group.float().movedim(-1, 1),
+                width,
+                height,
+                resize_filter,
+                "center"
+            ).movedim(1, -1)
+            image_batch[rows] = resized.to(image_batch.dtype)
+
+    return image_batch, images
+
+def make_mask_batch(masks, height, width, resize_filter="lanczos", dtype=torch.float32):
+    """
+    Build a (N, height, width) mask batch matching an image batch.
+    Missing masks (None) become empty rows. Returns (mask_batch, masks) where masks that
+    already match the size are replaced by views into the batch storage.
+    """
+    masks = list(masks)
+    mask_batch = torch.zeros((max(1, len(masks)), height, width), dtype=dtype)
+
+    # Group mismatched masks by source shape, like make_image_batch
+    mismatched = {}
+    for row, mask in enumerate(masks):
+        if mask is None:
+            continue
+        if tuple(mask.shape[1:]) == (height, width):
+            masks[row] = convert_image(mask, dtype, out=mask_batch[row:row + 1])
+        else:
+            mismatched.setdefault(tuple(mask.shape[1:]), []).append(row)
+
+    if mismatched:
+        import comfy.utils
+        # Masks are single channel, lanczos falls back to bicubic
+        mode = "bicubic" if resize_filter == "lanczos" else resize_filter
+        for rows in mismatched.values():
+            group = torch.cat([convert_image(masks[row], torch.float32) for row in rows], dim=0)
+            # Same center crop as the image rows, so each mask row lines up with its image row
+            resized = comfy.utils.common_upscale(group[:, None], width, height, mode, "center")[:, 0]
+            mask_batch[rows] = resized.clamp_(0.0, 1.0).to(mask_batch.dtype)
+    return mask_batch, masks
 
 class CRZImageSelector:
     @classmethod
@@ -18,91 +282,104 @@ class CRZImageSelector:
                 "image_4": ("STRING", {"default": ""}),
                 "image_5": ("STRING", {"default": ""}),
                 "image_6": ("STRING", {"default": ""}),
+            },
+            "optional": {
+                "batch_size_mode": (["first", "largest", "smallest", "fixed"], {"default": "first"}),
+                "batch_width": ("INT", {"default": 512, "min": 16, "max": 16384, "step": 8}),
+                "batch_height": ("INT", {"default": 512, "min": 16, "max": 16384, "step": 8}),
+                "resize_filter": (["lanczos", "bicubic", "bilinear", "area", "nearest-exact"], {"default": "lanczos"}),
+                "fast_decode": ("BOOLEAN", {"default": False}),
+                "output_dtype": (["float32", "float16"], {"default": "float32"}),
+                "keep_uint8": ("BOOLEAN", {"default": False}),
+            },
+            "hidden": {
+                # Used to find which slot outputs are wired, see slot_draft_sizes
+                "prompt": "PROMPT",
+                "unique_id": "UNIQUE_ID",
             }
         }
 
-    RETURN_TYPES = ("IMAGE", "IMAGE", "IMAGE", "IMAGE", "IMAGE", "IMAGE", "INT", "IMAGE")
-    RETURN_NAMES = ("image_1", "image_2", "image_3", "image_4", "image_5", "image_6", "image_count", "image_batch")
+    RETURN_TYPES = ("IMAGE", "IMAGE", "IMAGE", "IMAGE", "IMAGE", "IMAGE", "INT", "IMAGE",
+                    "MASK", "MASK", "MASK", "MASK", "MASK", "MASK", "MASK")
+    RETURN_NAMES = ("image_1", "image_2", "image_3", "image_4", "image_5", "image_6", "image_count", "image_batch",
+                    "mask_1", "mask_2", "mask_3", "mask_4", "mask_5", "mask_6", "mask_batch")
     FUNCTION = "load_images"
     CATEGORY = "CRZ"
 
-    def load_image(self, image_path):
-        """Load a single image and return image tensor"""
-        if not image_path or image_path == "":
-            # Return a blank 64x64 black image if no path provided
-            blank_image = torch.zeros((1, 64, 64, 3), dtype=torch.float32)
-            return blank_image
-        
-        try:
-            input_dir = folder_paths.get_input_directory()
-            full_path = os.path.join(input_dir, image_path)
-            
-            if not os.path.exists(full_path):
-                # Return blank image if file doesn't exist
-                blank_image = torch.zeros((1, 64, 64, 3), dtype=torch.float32)
-                return blank_image
-            
-            # Load image
-            i = Image.open(full_path)
-            i = ImageOps.exif_transpose(i)
-            image = i.convert("RGB")
-            image = np.array(image).astype(np.float32) / 255.0
-            image = torch.from_numpy(image)[None,]
-            
-            return image
-        except Exception as e:
-            print(f"Error loading image {image_path}: {e}")
-            # Return blank image on error
-            blank_image = torch.zeros((1, 64, 64, 3), dtype=torch.float32)
-            return blank_image
+    @staticmethod
+    def load_params(batch_size_mode="first", batch_width=512, batch_height=512, fast_decode=False,
+                    output_dtype="float32", keep_uint8=False):
+        """Decode settings (draft_size, storage dtype) implied by the node options"""
+        # With a fixed batch size the target is known up front, so JPEGs can be decoded reduced
+        draft_size = (batch_width, batch_height) if fast_decode and batch_size_mode == "fixed" else None
+        # keep_uint8 holds decoded (and cached) pixels as uint8, converting only when emitting outputs
+        dtype = torch.float16 if output_dtype == "float16" else torch.float32
+        return draft_size, torch.uint8 if keep_uint8 else dtype
 
-    def load_images(self, image_1, image_2, image_3, image_4, image_5, image_6):
-        """Load all six images and count them"""
+    def load_image(self, image_path, draft_size=None, dtype=torch.float32):
+        """Load a single image and return (image, mask)"""
+        return load_image_file(image_path, draft_size, dtype)
+
+    def load_images(self, image_1, image_2, image_3, image_4, image_5, image_6,
+                    batch_size_mode="first", batch_width=512, batch_height=512, resize_filter="lanczos",
+                    fast_decode=False, output_dtype="float32", keep_uint8=False, prompt=None, unique_id=None):
+        """Load all six images and their masks and count them"""
         
         image_paths = [image_1, image_2, image_3, image_4, image_5, image_6]
         
         # Count non-empty image paths
         image_count = sum(1 for path in image_paths if path and path.strip() != "")
+
+        draft_size, storage_dtype = self.load_params(batch_size_mode, batch_width, batch_height, fast_decode,
+                                                     output_dtype, keep_uint8)
+        dtype = torch.float16 if output_dtype == "float16" else torch.float32
+        draft_sizes = slot_draft_sizes(draft_size, prompt, unique_id)
+        load = partial(self.load_image, dtype=storage_dtype)
         
-        img1 = self.load_image(image_1)
-        img2 = self.load_image(image_2)
-        img3 = self.load_image(image_3)
-        img4 = self.load_image(image_4)
-        img5 = self.load_image(image_5)
-        img6 = self.load_image(image_6)
-        
-        # Create image batch from non-empty images
-        images = [img1, img2, img3, img4, img5, img6]
-        non_empty_images = []
-        
-        for i, (img, path) in enumerate(zip(images, image_paths)):
-            if path and path.strip() != "":
-                non_empty_images.append(img)
-        
-        # Create batch similar to MakeImageBatch logic
-        if len(non_empty_images) == 0:
-            # Return a blank 64x64 black image if no images
-            image_batch = torch.zeros((1, 64, 64, 3), dtype=torch.float32)
-        elif len(non_empty_images) == 1:
-            image_batch = non_empty_images[0]
+        # Decode the slots concurrently (PIL releases the GIL for most codecs)
+        pool = get_decode_pool()
+        if pool is None:
+            loaded = [load(path, draft) for path, draft in zip(image_paths, draft_sizes)]
         else:
-            # Concatenate images, handling different sizes
-            image1 = non_empty_images[0]
-            for image2 in non_empty_images[1:]:
-                if image1.shape[1:] != image2.shape[1:]:
-                    # Resize image2 to match image1 dimensions
-                    import comfy.utils
-                    image2 = comfy.utils.common_upscale(
-                        image2.movedim(-1, 1), 
-                        image1.shape[2], 
-                        image1.shape[1], 
-                        "lanczos", 
-                        "center"
-                    ).movedim(1, -1)
-                image1 = torch.cat((image1, image2), dim=0)
-            image_batch = image1
-        
-        return (img1, img2, img3, img4, img5, img6, image_count, image_batch)
+            loaded = list(pool.map(load, image_paths, draft_sizes))
+        images = [image for image, _ in loaded]
+        masks = [mask for _, mask in loaded]
+
+        # Slots that take part in the batch
+        batch_slots = [i for i, path in enumerate(image_paths) if path and path.strip() != ""]
+
+        image_batch, batch_images = make_image_batch([images[slot] for slot in batch_slots],
+                                                     batch_size_mode, batch_width, batch_height, resize_filter, dtype)
+        for slot, image in zip(batch_slots, batch_images):
+            images[slot] = image
+        images = [convert_image(image, dtype) for image in images]
+
+        mask_batch, batch_masks = make_mask_batch([masks[slot] for slot in batch_slots],
+                                                  image_batch.shape[1], image_batch.shape[2], resize_filter, dtype)
+        for slot, mask in zip(batch_slots, batch_masks):
+            masks[slot] = mask
+        # Slots without transparency get an empty 64x64 mask, like LoadImage
+        masks = [torch.zeros((1, 64, 64), dtype=dtype) if mask is None else convert_image(mask, dtype) for mask in masks]
+
+        img1, img2, img3, img4, img5, img6 = images
+        mask1, mask2, mask3, mask4, mask5, mask6 = masks
+        return (img1, img2, img3, img4, img5, img6, image_count, image_batch,
+                mask1, mask2, mask3, mask4, mask5, mask6, mask_batch)
+
+    @classmethod
+    def IS_CHANGED(s, image_1, image_2, image_3, image_4, image_5, image_6, **kwargs):
+        # Fingerprint the referenced files so edits on disk re-run the node, but nothing else does
+        content = preferences.get("image_selector_fingerprint") == "content"
+        input_dir = folder_paths.get_input_directory()
+        m = hashlib.sha256()
+        for image_path in (image_1, image_2, image_3, image_4, image_5, image_6):
+            m.update(str(image_path).encode("utf-8"))
+            if image_path:
+                m.update(file_fingerprint(os.path.join(input_dir, image_path), content).encode("utf-8"))
+            m.update(b"\0")
+        return m.hexdigest()
+
+PromptServer.instance.add_on_prompt_handler(prefetch_prompt)
 
 NODE_CLASS_MAPPINGS = {
     "CRZImageSelector": CRZImageSelector,
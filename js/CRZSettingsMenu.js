@@ -0,0 +1,38 @@
+// CRZ Settings Menu - edit hidden settings widgets from a node's context menu
+// Shared by nodes that hide their widgets (Image Selector, Compare)
+
+// Add one context menu entry per settings widget
+export function addSettingsMenuOptions(node, canvas, options, settings) {
+    for (const widget of settings) {
+        options.push({
+            content: `${widget.name}: ${widget.value}`,
+            has_submenu: Array.isArray(widget.options?.values),
+            callback: (value, menuOptions, e, menu) => editSetting(node, widget, canvas, e, menu)
+        });
+    }
+    return options;
+}
+
+// Edit one of the hidden settings widgets
+export function editSetting(node, widget, canvas, e, menu) {
+    const apply = (v) => {
+        widget.value = v;
+        if (widget.callback) widget.callback(v);
+        node.setDirtyCanvas(true, true);
+    };
+
+    if (Array.isArray(widget.options?.values)) {
+        new LiteGraph.ContextMenu(widget.options.values, {
+            event: e,
+            parentMenu: menu,
+            callback: (value) => apply(value)
+        });
+    } else if (typeof widget.value === "boolean") {
+        apply(!widget.value);
+    } else if (typeof widget.value === "number") {
+        canvas.prompt(widget.name, widget.value, (v) => {
+            v = Number(v);
+            if (!isNaN(v)) apply(v);
+        }, e);
+    }
+}
@@ -12,11 +12,14 @@ import {
     HANDLE_CORNER_RADIUS,
     HANDLE_PADDING
 } from "./CRZConfig.js";
+import { addSettingsMenuOptions } from "./CRZSettingsMenu.js";
 
 // Compare node dimensions
 const COMPARE_WIDTH = 100;
 const COMPARE_HEIGHT = 48;
 
+const COMPARE_OPERATORS = ["=", "!=", ">", "<", ">=", "<="];
+
 app.registerExtension({
     name: "CRZCompare",
     async beforeRegisterNodeDef(nodeType, nodeData, app) {
@@ -51,6 +54,9 @@ app.registerExtension({
                             this.properties.operator = v;
                         });
                     }
+                    // Keep operator first so widget values saved before the optional inputs still load
+                    this.widgets.splice(this.widgets.indexOf(operatorWidget), 1);
+                    this.widgets.unshift(operatorWidget);
                     operatorWidget.value = this.properties.operator || "=";
                     operatorWidget.hidden = true;
                     operatorWidget.type = "hidden";
@@ -113,10 +119,10 @@ app.registerExtension({
                     const currentOp = this.properties.operator || "=";
                     
                     canvas.prompt(
-                        "Comparison Operator (=, >, <, >=, <=)", 
+                        "Comparison Operator (=, !=, >, <, >=, <=)", 
                         currentOp,
                         function(newOp) {
-                            if (newOp && (newOp === "=" || newOp === ">" || newOp === "<" || newOp === ">=" || newOp === "<=")) {
+                            if (newOp && COMPARE_OPERATORS.includes(newOp)) {
                                 this.properties.operator = newOp;
                                 
                                 // Update the hidden widget to sync with Python
@@ -145,6 +151,12 @@ app.registerExtension({
                 return [COMPARE_WIDTH, COMPARE_HEIGHT];
             };
 
+            // Tensor comparison settings (reduction, threshold, tolerances) are edited from the context menu
+            nodeType.prototype.getExtraMenuOptions = function(canvas, options) {
+                const settings = (this.widgets || []).filter(w => w.name !== "operator");
+                return addSettingsMenuOptions(this, canvas, options, settings);
+            };
+
             // Custom drawing for the compare visualization
             nodeType.prototype.onDrawForeground = function(ctx) {
                 if (this.flags.collapsed) return;
@@ -213,6 +225,9 @@ app.registerExtension({
                                     case "<=":
                                         previewResult = (Number(aValue) <= Number(bValue));
                                         break;
+                                    case "!=":
+                                        previewResult = (aValue != bValue);
+                                        break;
                                     case "=":
                                     default:
                                         previewResult = (aValue == bValue);
@@ -626,6 +626,15 @@ app.registerExtension({
                     }
                 }
                 
+                // Send the slider name with the prompt so Dashboard Get nodes can find this node
+                let nameWidget = this.widgets && this.widgets.find(w => w.name === "slider_name");
+                if (!nameWidget) {
+                    nameWidget = this.addWidget("text", "slider_name", "", function(v) {});
+                }
+                nameWidget.hidden = true;
+                nameWidget.type = "hidden";
+                nameWidget.serializeValue = () => this.properties.slider_name ?? "Dashboard Node";
+                
                 // Simple hiding 
                 this.onAdded = function() {
                     this.outputs[0].name = this.outputs[0].localized_name = "";
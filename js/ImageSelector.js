@@ -26,6 +26,7 @@ import {
     CLEAR_BUTTON_FONT_SIZE,
     CLEAR_BUTTON_WIDTH_RATIO
 } from "./CRZConfig.js";
+import { addSettingsMenuOptions } from "./CRZSettingsMenu.js";
 
 app.registerExtension({
     name: "CRZ.ImageSelector",
@@ -76,11 +77,13 @@ app.registerExtension({
                     });
                 }
                 
-                // Set output socket labels - keep the batch output visible
+                // Set output socket labels - keep the batch outputs visible
                 if (this.outputs) {
                     this.outputs.forEach((output, index) => {
                         if (index === 7) { // 8th output (index 7) is the batch output
                             output.name = output.localized_name = "🖹";
+                        } else if (index === 14) { // Last output (index 14) is the mask batch
+                            output.name = output.localized_name = "◐";
                         } else {
                             output.name = output.localized_name = " ";
                         }
@@ -234,8 +237,7 @@ app.registerExtension({
 
                 const img = new Image();
                 img.onload = () => {
-                    // Store the full resolution image directly - no pre-scaling!
-                    // This gives maximum quality when we scale it down during drawing
+                    // Server sends a small cached thumbnail, drawn scaled to fit the cell
                     this.thumbnails[widgetName] = img;
                     this.setDirtyCanvas(true);
                 };
@@ -245,8 +247,8 @@ app.registerExtension({
                     this.setDirtyCanvas(true);
                 };
                 
-                // Load from ComfyUI input directory
-                img.src = `/view?filename=${encodeURIComponent(filename)}&type=input`;
+                // Load a thumbnail of the file in the ComfyUI input directory
+                img.src = `/crz/thumbnail?filename=${encodeURIComponent(filename)}`;
             };
 
 
@@ -274,7 +276,7 @@ app.registerExtension({
                     if (this.thumbnails[widgetName]) {
                         const img = this.thumbnails[widgetName];
                         
-                        // Enable highest quality scaling for full-resolution images
+                        // Enable highest quality scaling for the thumbnail
                         ctx.imageSmoothingEnabled = true;
                         ctx.imageSmoothingQuality = 'high';
                         
@@ -307,7 +309,7 @@ app.registerExtension({
                         ctx.roundRect(x, y, rect.width, rect.height, 8);
                         ctx.clip();
                         
-                        // Draw full-resolution image scaled down to fit entirely in cell
+                        // Draw thumbnail scaled to fit entirely in cell
                         ctx.drawImage(img, x + offsetX, y + offsetY, drawWidth, drawHeight);
                         ctx.restore();
                         
@@ -448,7 +450,8 @@ app.registerExtension({
                 formData.append('type', 'input');
                 formData.append('subfolder', '');
                 
-                fetch('/upload/image', {
+                // Content-addressed upload: identical files map to the same stored name
+                fetch('/crz/upload/image', {
                     method: 'POST',
                     body: formData
                 })
@@ -507,8 +510,9 @@ app.registerExtension({
 
             // Override getExtraMenuOptions to prevent widget-related menu items
             nodeType.prototype.getExtraMenuOptions = function(canvas, options) {
-                // Don't add widget-related menu options
-                return options;
+                // The image_N widgets stay hidden, the remaining (batch) settings are edited from here
+                const settings = (this.widgets || []).filter(w => !w.name.startsWith("image_"));
+                return addSettingsMenuOptions(this, canvas, options, settings);
             };
 
             // Prevent connections to input sockets
@@ -0,0 +1,57 @@
+// ComfyUI - CRZ Index Switch JS Extension
+import { app } from "../../scripts/app.js";
+
+app.registerExtension({
+    name: "CRZ.IndexSwitch",
+    async beforeRegisterNodeDef(nodeType, nodeData, app) {
+        if (nodeData.name === "CRZIndexSwitch") {
+            const onNodeCreated = nodeType.prototype.onNodeCreated;
+            nodeType.prototype.onNodeCreated = function () {
+                const r = onNodeCreated ? onNodeCreated.apply(this, arguments) : undefined;
+
+                // Mark as CRZ node for connection hiding
+                this.isCRZNode = true;
+                this.updateSwitchInputs();
+
+                return r;
+            };
+
+            // Keep exactly one free input_N socket after the last connected one
+            nodeType.prototype.updateSwitchInputs = function () {
+                if (!this.inputs) return;
+
+                const switchInputs = this.inputs
+                    .map((input, slot) => ({ input, slot }))
+                    .filter(({ input }) => /^input_\d+$/.test(input.name));
+
+                let lastConnected = -1;
+                switchInputs.forEach(({ input }, i) => {
+                    if (input.link !== null && input.link !== undefined) lastConnected = i;
+                });
+
+                // Remove surplus free sockets from the end, never going below input_0 and input_1
+                const keep = Math.max(2, lastConnected + 2);
+                for (let i = switchInputs.length - 1; i >= keep; i--) {
+                    this.removeInput(switchInputs[i].slot);
+                }
+                for (let i = switchInputs.length; i < keep; i++) {
+                    this.addInput(`input_${i}`, "*");
+                }
+
+                if (this.graph && this.graph.setDirtyCanvas) {
+                    this.graph.setDirtyCanvas(true, true);
+                }
+            };
+
+            const onConnectionsChange = nodeType.prototype.onConnectionsChange;
+            nodeType.prototype.onConnectionsChange = function (type, slotIndex, isConnected, linkInfo, ioSlot) {
+                const r = onConnectionsChange ? onConnectionsChange.apply(this, arguments) : undefined;
+                if (type === LiteGraph.INPUT) {
+                    // Defer so the link bookkeeping is finished before sockets move
+                    setTimeout(() => this.updateSwitchInputs(), 0);
+                }
+                return r;
+            };
+        }
+    }
+});
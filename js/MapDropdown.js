@@ -1,10 +1,13 @@
 // ComfyUI - CRZ Map Dropdown JS Extension
 import { app } from "../../scripts/app.js";
 
+// Node types sharing this extension, the unbounded variant accepts any number of options
+const MAP_DROPDOWN_TYPES = ["CRZMapDropdown", "CRZMapDropdownUnbounded"];
+
 app.registerExtension({
     name: "CRZ.MapDropdown",
     async beforeRegisterNodeDef(nodeType, nodeData, app) {
-        if (nodeData.name === "CRZMapDropdown") {
+        if (MAP_DROPDOWN_TYPES.includes(nodeData.name)) {
             // Remove title 
             nodeType.title_mode = LiteGraph.NO_TITLE;
 
@@ -596,7 +599,7 @@ app.registerExtension({
                         try {
                             // Find all MapDropdown nodes that might be connected to this dropdown
                             const mapDropdownNodes = Object.values(this.graph._nodes_by_id).filter(node => 
-                                node && node.type === "CRZMapDropdown"
+                                node && MAP_DROPDOWN_TYPES.includes(node.type)
                             );
                             
                             mapDropdownNodes.forEach(mapDropdown => {
@@ -666,7 +669,7 @@ app.registerExtension({
                         try {
                             // Find all MapDropdown nodes that might be connected to this reroute
                             const mapDropdownNodes = Object.values(this.graph._nodes_by_id).filter(node => 
-                                node && node.type === "CRZMapDropdown"
+                                node && MAP_DROPDOWN_TYPES.includes(node.type)
                             );
                             
                             mapDropdownNodes.forEach(mapDropdown => {
@@ -0,0 +1,59 @@
+// ComfyUI - CRZ Preset Table JS Extension
+import { app } from "../../scripts/app.js";
+
+app.registerExtension({
+    name: "CRZ.PresetTable",
+    async beforeRegisterNodeDef(nodeType, nodeData, app) {
+        if (nodeData.name === "CRZPresetTable") {
+            const onNodeCreated = nodeType.prototype.onNodeCreated;
+            nodeType.prototype.onNodeCreated = function () {
+                const r = onNodeCreated ? onNodeCreated.apply(this, arguments) : undefined;
+
+                // Mark as CRZ node for connection hiding
+                this.isCRZNode = true;
+
+                // Relabel the outputs whenever the table header changes
+                const tableWidget = this.widgets && this.widgets.find(w => w.name === "table");
+                if (tableWidget) {
+                    const originalCallback = tableWidget.callback;
+                    tableWidget.callback = (value, ...args) => {
+                        if (originalCallback) {
+                            originalCallback.call(tableWidget, value, ...args);
+                        }
+                        this.updateOutputLabels();
+                    };
+                }
+                this.updateOutputLabels();
+
+                return r;
+            };
+
+            // Name each output after its column in the header line
+            nodeType.prototype.updateOutputLabels = function () {
+                const tableWidget = this.widgets && this.widgets.find(w => w.name === "table");
+                if (!tableWidget || !this.outputs) return;
+
+                const header = String(tableWidget.value || "")
+                    .split("\n")
+                    .find(line => line.trim() && !line.trim().startsWith("#")) || "";
+                const columns = header.split(",").slice(1).map(cell => cell.split(":")[0].trim());
+
+                for (let i = 0; i < this.outputs.length; i++) {
+                    const column = columns[i];
+                    this.outputs[i].label = column ? column : `value_${i + 1}`;
+                }
+
+                if (this.graph && this.graph.setDirtyCanvas) {
+                    this.graph.setDirtyCanvas(true, true);
+                }
+            };
+
+            const onConfigure = nodeType.prototype.onConfigure;
+            nodeType.prototype.onConfigure = function (info) {
+                const r = onConfigure ? onConfigure.apply(this, arguments) : undefined;
+                this.updateOutputLabels();
+                return r;
+            };
+        }
+    }
+});
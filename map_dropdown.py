@@ -1,5 +1,8 @@
-import torch
 import json
+import hashlib
+from functools import lru_cache
+from .preferences import preferences
+from .dynamic_inputs import lazy_dynamic_inputs
 
 # This is a hack to work around ComfyUI's type validation system
 class AnyTypeStr(str):
@@ -12,6 +15,46 @@ class AnyTypeStr(str):
 # Use the any type hack that works with ComfyUI's validation
 AnyType = AnyTypeStr("*")
 
+def get_selected_value(custom_dropdown):
+    """Get the selected value from whatever the dropdown input delivered"""
+    if isinstance(custom_dropdown, str):
+        return custom_dropdown
+    elif hasattr(custom_dropdown, 'get_value'):
+        return custom_dropdown.get_value()
+    elif hasattr(custom_dropdown, 'value'):
+        return custom_dropdown.value
+    return str(custom_dropdown)
+
+@lru_cache(maxsize=64)
+def parse_dropdown_options(dropdown_options_str):
+    """
+    Parse the JSON option list sent by the frontend into (options, value -> index).
+    Memoized per distinct options string, so repeated queues skip the parse and the scan.
+    """
+    try:
+        options = json.loads(dropdown_options_str)
+    except:
+        options = []
+    if not isinstance(options, list):
+        options = []
+
+    option_index = {}
+    for index, option in enumerate(options):
+        try:
+            # First occurrence wins, same as list.index
+            option_index.setdefault(option, index)
+        except TypeError:
+            pass
+    return tuple(options), option_index
+
+def get_selected_index(selected_value, dropdown_options_str):
+    """Index of the selected value in the options, 0 if it isn't one of them"""
+    _, option_index = parse_dropdown_options(dropdown_options_str)
+    try:
+        return option_index.get(selected_value, 0)
+    except TypeError:
+        return 0
+
 class MapDropdown:
     @classmethod
     def INPUT_TYPES(s):
@@ -21,16 +64,16 @@ class MapDropdown:
             },
             "optional": {
                 "dropdown_options": ("STRING", {"default": "[]"}),
-                "option_0": (AnyType,),
-                "option_1": (AnyType,),
-                "option_2": (AnyType,),
-                "option_3": (AnyType,),
-                "option_4": (AnyType,),
-                "option_5": (AnyType,),
-                "option_6": (AnyType,),
-                "option_7": (AnyType,),
-                "option_8": (AnyType,),
-                "option_9": (AnyType,),
+                "option_0": (AnyType, {"lazy": True}),
+                "option_1": (AnyType, {"lazy": True}),
+                "option_2": (AnyType, {"lazy": True}),
+                "option_3": (AnyType, {"lazy": True}),
+                "option_4": (AnyType, {"lazy": True}),
+                "option_5": (AnyType, {"lazy": True}),
+                "option_6": (AnyType, {"lazy": True}),
+                "option_7": (AnyType, {"lazy": True}),
+                "option_8": (AnyType, {"lazy": True}),
+                "option_9": (AnyType, {"lazy": True}),
             }
         }
 
@@ -39,75 +82,70 @@ class MapDropdown:
     FUNCTION = "map_dropdown"
     CATEGORY = "CRZ"
 
-    def map_dropdown(self, custom_dropdown, **kwargs):
+    def check_lazy_status(self, custom_dropdown=None, dropdown_options="[]", **kwargs):
+        # The selection has to be known before we can tell which option is needed
+        if custom_dropdown is None:
+            return ["custom_dropdown"]
+
+        selected_index = get_selected_index(get_selected_value(custom_dropdown), dropdown_options)
+
+        # Only evaluate the option that will be returned, unconnected options are not in kwargs
+        needed = f"option_{selected_index}"
+        if needed in kwargs and kwargs[needed] is None:
+            return [needed]
+        return []
+
+    def map_dropdown(self, custom_dropdown, dropdown_options="[]", **kwargs):
         # Get the selected value from the dropdown
-        selected_value = None
-        if isinstance(custom_dropdown, str):
-            selected_value = custom_dropdown
-        elif hasattr(custom_dropdown, 'get_value'):
-            selected_value = custom_dropdown.get_value()
-        elif hasattr(custom_dropdown, 'value'):
-            selected_value = custom_dropdown.value
-        else:
-            selected_value = str(custom_dropdown)
-        
-        # Get dropdown options from kwargs
-        dropdown_options_str = kwargs.get('dropdown_options', '[]')
-        try:
-            import json
-            dropdown_options = json.loads(dropdown_options_str)
-        except:
-            dropdown_options = []
-        
-        # Debug: Print what we're getting
-        print(f"MapDropdown Debug - Selected value: {selected_value}")
-        print(f"MapDropdown Debug - Dropdown options: {dropdown_options}")
-        print(f"MapDropdown Debug - Available kwargs: {list(kwargs.keys())}")
-        
-        # Get all option inputs that have data
-        option_inputs = {}
-        for key, value in kwargs.items():
-            if key.startswith('option_') and value is not None:
-                # Extract the index from option_X
-                try:
-                    index = int(key.split('_')[1])
-                    option_inputs[index] = value
-                except (ValueError, IndexError):
-                    pass
-        
-        print(f"MapDropdown Debug - Option inputs: {option_inputs}")
-        
-        # Find the selected option index
-        selected_index = 0
-        if selected_value in dropdown_options:
-            selected_index = dropdown_options.index(selected_value)
-            print(f"MapDropdown Debug - Found selected value '{selected_value}' at index {selected_index}")
-        else:
-            print(f"MapDropdown Debug - Selected value '{selected_value}' not found in options, using index 0")
-        
+        selected_value = get_selected_value(custom_dropdown)
+        selected_index = get_selected_index(selected_value, dropdown_options)
+        value = kwargs.get(f"option_{selected_index}")
+
+        # Debug output is off by default, it runs on every execution
+        if preferences.get("map_dropdown_debug"):
+            option_count = len(parse_dropdown_options(dropdown_options)[0])
+            print(f"MapDropdown Debug - Selected value '{selected_value}' at index {selected_index} of {option_count} options")
+            if value is None:
+                print(f"MapDropdown Debug - No data for option_{selected_index}, returning None")
+
         # Return the data from the selected option
-        if selected_index in option_inputs:
-            print(f"MapDropdown Debug - Returning option_{selected_index}: {option_inputs[selected_index]}")
-            return (option_inputs[selected_index],)
-        else:
-            print(f"MapDropdown Debug - No data for option_{selected_index}, returning None")
-            return (None,)
+        return (value,)
 
     @classmethod
-    def VALIDATE_INPUTS(s, custom_dropdown, **kwargs):
+    def VALIDATE_INPUTS(s, custom_dropdown=None, **kwargs):
         # Accept any type for all inputs
         return True
 
     @classmethod
-    def IS_CHANGED(s, custom_dropdown, **kwargs):
-        # Always consider changed to ensure dynamic outputs update
-        return True
+    def IS_CHANGED(s, custom_dropdown=None, dropdown_options="[]", **kwargs):
+        # A linked dropdown already invalidates us through its own output, so only the
+        # options and a constant selection need to be fingerprinted
+        m = hashlib.sha256()
+        m.update(str(dropdown_options).encode("utf-8"))
+        if custom_dropdown is not None:
+            m.update(b"\0" + str(get_selected_value(custom_dropdown)).encode("utf-8"))
+        return m.hexdigest()
+
+class MapDropdownUnbounded(MapDropdown):
+    """MapDropdown with one lazy option input per dropdown option, however many there are"""
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "custom_dropdown": (AnyType, {"lazy": True}),
+            },
+            "optional": lazy_dynamic_inputs("option_", {
+                "dropdown_options": ("STRING", {"default": "[]"}),
+            })
+        }
 
 
 NODE_CLASS_MAPPINGS = {
-    "CRZMapDropdown": MapDropdown
+    "CRZMapDropdown": MapDropdown,
+    "CRZMapDropdownUnbounded": MapDropdownUnbounded,
 }
 
 NODE_DISPLAY_NAME_MAPPINGS = {
-    "CRZMapDropdown": "CRZ Map Custom Dropdown"
+    "CRZMapDropdown": "CRZ Map Custom Dropdown",
+    "CRZMapDropdownUnbounded": "CRZ Map Custom Dropdown (Unbounded)",
 }
@@ -10,7 +10,15 @@ class CRZPreferences:
             "passthrough_show_connections": True,
             "image_selector_thumbnail_size": 64,
             "dashboard_theme": "dark",
-            "float_slider_precision": 2
+            "float_slider_precision": 2,
+            "image_selector_cache_mb": 1024,
+            "image_selector_decode_workers": 4,
+            "image_selector_fingerprint": "stat",
+            "image_selector_disk_cache_mb": 0,
+            "image_selector_prefetch_max": 12,
+            "map_dropdown_debug": False,
+            "prompt_pruner_enabled": False,
+            "prompt_fold_enabled": False
         }
         self.prefs = self.load_preferences()
     
@@ -33,7 +41,9 @@ class CRZPreferences:
             print(f"Error saving CRZ preferences: {e}")
     
     def get(self, key, default=None):
-        """Get a preference value"""
+        """Get a preference value, falling back to the built-in default"""
+        if default is None:
+            default = self.default_prefs.get(key)
         return self.prefs.get(key, default)
     
     def set(self, key, value):
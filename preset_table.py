@@ -0,0 +1,125 @@
+# ComfyUI - CRZ Preset Table
+import csv
+from functools import lru_cache
+
+# This is a hack to work around ComfyUI's type validation system
+class AnyTypeStr(str):
+    def __eq__(self, __value: object) -> bool:
+        return True
+
+    def __ne__(self, __value: object) -> bool:
+        return False
+
+# Use the any type hack that works with ComfyUI's validation
+AnyType = AnyTypeStr("*")
+
+MAX_COLUMNS = 8
+
+DEFAULT_TABLE = """name, steps:INT, cfg:FLOAT, sampler:STRING, width:INT, height:INT
+fast, 12, 4.5, euler, 768, 768
+quality, 30, 7.0, dpmpp_2m, 1024, 1024"""
+
+def smart_convert(text):
+    """Convert an untyped cell the same way Custom Dropdown values are converted"""
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+def convert_cell(text, column_type):
+    """Convert one table cell to its column type, empty cells become the type's zero value"""
+    if column_type == "INT":
+        return int(float(text)) if text else 0
+    if column_type == "FLOAT":
+        return float(text) if text else 0.0
+    if column_type == "BOOLEAN":
+        return text.lower() in ("true", "yes", "on", "1")
+    if column_type == "STRING":
+        return text
+    return smart_convert(text) if text else None
+
+def preset_key(value):
+    """Normalize a dropdown value to a row key, whole floats match their integer spelling"""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+@lru_cache(maxsize=32)
+def parse_preset_table(table):
+    """
+    Parse the table text into (columns, rows, first_key).
+    The first line is the header: the key column, then up to MAX_COLUMNS value columns
+    written as name or name:TYPE (INT, FLOAT, STRING, BOOLEAN).
+    Each following line is a row, key first. Blank lines and lines starting with # are skipped.
+    Cells are converted once here, so a lookup is a single dict access.
+    """
+    lines = [line for line in table.splitlines() if line.strip() and not line.lstrip().startswith("#")]
+    records = [[cell.strip() for cell in record] for record in csv.reader(lines, skipinitialspace=True)]
+    if not records:
+        return (), {}, None
+
+    columns = []
+    for cell in records[0][1:MAX_COLUMNS + 1]:
+        name, _, column_type = cell.partition(":")
+        columns.append((name.strip(), column_type.strip().upper()))
+
+    rows = {}
+    first_key = None
+    for row_number, record in enumerate(records[1:], start=1):
+        if not record:
+            continue
+        key = preset_key(record[0])
+        cells = record[1:len(columns) + 1]
+        cells += [""] * (len(columns) - len(cells))
+        try:
+            values = tuple(convert_cell(cell, column_type) for cell, (_, column_type) in zip(cells, columns))
+        except ValueError as e:
+            raise ValueError(f"CRZ Preset Table: bad value in preset row {row_number} ('{key}'): {e}")
+        # First row with a key wins, like MapDropdown's first matching option
+        rows.setdefault(key, values)
+        if first_key is None:
+            first_key = key
+    return tuple(columns), rows, first_key
+
+class CRZPresetTable:
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "custom_dropdown": (AnyType,),  # Selected preset, usually a Custom Dropdown
+                "table": ("STRING", {"default": DEFAULT_TABLE, "multiline": True}),
+            },
+        }
+
+    RETURN_TYPES = (AnyType,) * MAX_COLUMNS
+    RETURN_NAMES = tuple(f"value_{i + 1}" for i in range(MAX_COLUMNS))
+    FUNCTION = "lookup"
+    CATEGORY = "CRZ"
+
+    def lookup(self, custom_dropdown, table):
+        """
+        Output the whole row selected by the dropdown, one output per column.
+        Unknown keys fall back to the first row, unused outputs are None.
+        """
+        columns, rows, first_key = parse_preset_table(table)
+        values = rows.get(preset_key(custom_dropdown))
+        if values is None:
+            values = rows.get(first_key, ())
+        return values + (None,) * (MAX_COLUMNS - len(values))
+
+    @classmethod
+    def VALIDATE_INPUTS(s, custom_dropdown=None, table=None):
+        # Accept any type for the dropdown value
+        return True
+
+NODE_CLASS_MAPPINGS = {
+    "CRZPresetTable": CRZPresetTable,
+}
+
+NODE_DISPLAY_NAME_MAPPINGS = {
+    "CRZPresetTable": "CRZ Preset Table",
+}
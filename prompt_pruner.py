@@ -0,0 +1,411 @@
+# ComfyUI - CRZ Prompt Pruner
+import time
+import nodes
+from server import PromptServer
+from .preferences import preferences
+from .map_dropdown import get_selected_value, get_selected_index
+from .switch import get_switch_index
+from .dynamic_inputs import is_dynamic_input
+from .execute_switch import MAX_ROUTES
+
+try:
+    from comfy_execution.validation import validate_node_input
+except ImportError:
+    def validate_node_input(received_type, input_type, strict=False):
+        """Link type check ComfyUI applies when validating a prompt (older versions lack the module)"""
+        # AnyType's __ne__ makes "*" match everything, on either side
+        if not received_type != input_type:
+            return True
+        if not isinstance(received_type, str) or not isinstance(input_type, str):
+            return False
+        received_types = set(t.strip() for t in received_type.split(","))
+        input_types = set(t.strip() for t in input_type.split(","))
+        if "*" in received_types or "*" in input_types or received_types == input_types:
+            return True
+        if strict:
+            return received_types.issubset(input_types)
+        return len(received_types.intersection(input_types)) > 0
+
+# CRZ nodes without side effects, their outputs are constant when all their inputs are
+CONSTANT_NODES = {
+    "CRZBooleanToggle",
+    "CRZFloatSlider",
+    "CRZIntegerSlider",
+    "CRZDropdown",
+    "CRZCustomDropdown",
+    "CRZStringNode",
+    "CRZDashboardNode",
+    "CRZPassthrough",
+    "CRZFloatToInt",
+    "CRZIntToFloat",
+    "CRZCompare",
+}
+
+# Converters whose constant output can be written straight into the consumer's input
+CONVERTER_NODES = {"CRZFloatToInt", "CRZIntToFloat"}
+
+# Literal types that can replace a link on a consumer input without being cast by validation
+LITERAL_TYPES = {"INT": int, "FLOAT": float, "*": (int, float)}
+
+# Report of the last pruned prompt, served at /crz/pruner/report
+last_report = {}
+
+def is_link(value):
+    return isinstance(value, list) and len(value) == 2 and isinstance(value[1], int)
+
+class PromptPruner:
+    """
+    Statically resolves CRZ control flow in an API format prompt.
+    Switches, map dropdowns and execute nodes whose selector only depends on constant CRZ
+    controls are bypassed (their consumers are linked straight to the selected source) or,
+    for blocked outputs, everything downstream is removed. Nodes no output depends on any
+    more are then dropped, so the executor never validates or schedules dead branches.
+    fold() separately collapses Passthrough and Int/Float converter nodes into direct links.
+    """
+    def __init__(self, prompt):
+        self.prompt = prompt
+        self.constants = {}
+        self.input_types = {}
+        self.decisions = []
+        self.folded = []
+
+    def node_class(self, class_type):
+        return nodes.NODE_CLASS_MAPPINGS.get(class_type)
+
+    def input_spec(self, class_type, input_name):
+        """INPUT_TYPES entry of a node input, None if unknown"""
+        if class_type not in self.input_types:
+            node_class = self.node_class(class_type)
+            self.input_types[class_type] = node_class.INPUT_TYPES() if node_class is not None else {}
+        input_types = self.input_types[class_type]
+        for category in ("required", "optional", "hidden"):
+            inputs = input_types.get(category) or {}
+            if input_name in inputs:
+                return inputs[input_name]
+        return None
+
+    def input_info(self, class_type, input_name):
+        """Options dict of a node input, {} if unknown"""
+        info = self.input_spec(class_type, input_name)
+        return info[1] if isinstance(info, tuple) and len(info) > 1 and isinstance(info[1], dict) else {}
+
+    def resolve(self, value):
+        """(True, value) if an input is a constant or a link to a constant CRZ output, else (False, None)"""
+        if not is_link(value):
+            return True, value
+        node_id, slot = str(value[0]), value[1]
+        if node_id not in self.constants:
+            # Guard against cycles while this node is being evaluated
+            self.constants[node_id] = None
+            self.constants[node_id] = self.evaluate(node_id)
+        outputs = self.constants[node_id]
+        if outputs is None or slot >= len(outputs):
+            return False, None
+        return True, outputs[slot]
+
+    def evaluate(self, node_id):
+        """Run a side effect free CRZ node on constant inputs, None if that isn't possible"""
+        node = self.prompt.get(node_id)
+        if not isinstance(node, dict) or node.get("class_type") not in CONSTANT_NODES:
+            return None
+        node_class = self.node_class(node["class_type"])
+        if node_class is None:
+            return None
+        inputs = {}
+        for name, value in node.get("inputs", {}).items():
+            constant, inputs[name] = self.resolve(value)
+            if not constant:
+                return None
+        try:
+            return getattr(node_class(), node_class.FUNCTION)(**inputs)
+        except Exception:
+            return None
+
+    def decide(self, node_id, node):
+        """
+        Work out a constant-driven control flow node.
+        Returns ({output slot: source link, or None to block it}, {dead input: replacement link,
+        or None to drop it}) or None. Dead inputs only matter when the node has to be kept.
+        """
+        class_type = node.get("class_type")
+        inputs = node.get("inputs", {})
+
+        if class_type == "CRZSwitch":
+            constant, value = self.resolve(inputs.get("value", False))
+            if not constant:
+                return None
+            source = inputs.get("true_input" if value else "false_input")
+            # Both inputs are required, the unused one is pointed at the live source instead
+            return ({0: source}, {"false_input" if value else "true_input": source}) if is_link(source) else None
+
+        if class_type in ("CRZMapDropdown", "CRZMapDropdownUnbounded", "CRZIndexSwitch"):
+            if class_type == "CRZIndexSwitch":
+                constant, select = self.resolve(inputs.get("select", 0))
+                prefix = "input_"
+                if constant:
+                    index = get_switch_index(select, inputs.get("keys", ""))
+            else:
+                constant, select = self.resolve(inputs.get("custom_dropdown"))
+                prefix = "option_"
+                if constant:
+                    index = get_selected_index(get_selected_value(select), inputs.get("dropdown_options", "[]"))
+            if not constant:
+                return None
+            selected = f"{prefix}{index}"
+            source = inputs.get(selected)
+            unused = {name: None for name in inputs if name != selected and is_dynamic_input(name, prefix)}
+            if is_link(source):
+                return {0: source}, unused
+            # Nothing connected to the selection, the node outputs None but no other option is needed
+            return ({}, unused) if unused else None
+
+        if class_type in ("CRZExecuteBlock", "CRZExecuteSwitch"):
+            constant, value = self.resolve(inputs.get("bool", False))
+            source = inputs.get("input")
+            if not constant or not is_link(source):
+                return None
+            if class_type == "CRZExecuteBlock":
+                return {0: source if value else None}, {}
+            return {0: source if value else None, 1: None if value else source}, {}
+
+        if class_type == "CRZExecuteRouter":
+            constant, select = self.resolve(inputs.get("select", 0))
+            source = inputs.get("input")
+            if not constant or not is_link(source):
+                return None
+            index = get_switch_index(select, inputs.get("keys", ""))
+            return {i: source if i == index else None for i in range(MAX_ROUTES)}, {}
+
+        return None
+
+    def consumers(self, node_id, slot=None):
+        """(consumer id, input name) pairs reading from node_id (a given output slot, or any)"""
+        found = []
+        for consumer_id, node in self.prompt.items():
+            for name, value in node.get("inputs", {}).items():
+                if is_link(value) and str(value[0]) == node_id and (slot is None or value[1] == slot):
+                    found.append((consumer_id, name))
+        return found
+
+    def blocked_nodes(self, node_id, slot):
+        """
+        Every node an ExecutionBlocker on this output would stop, or None if a lazy input
+        on the way means the block might never be evaluated.
+        """
+        blocked = set()
+        pending = self.consumers(node_id, slot)
+        while pending:
+            consumer_id, name = pending.pop()
+            consumer = self.prompt[consumer_id]
+            if self.input_info(consumer.get("class_type"), name).get("lazy"):
+                return None
+            if consumer_id not in blocked:
+                blocked.add(consumer_id)
+                pending.extend(self.consumers(consumer_id))
+        return blocked
+
+    def accepts_link(self, source, consumer_id, input_name):
+        """True if ComfyUI's validation accepts a link from source into a consumer input"""
+        node_class = self.node_class(self.prompt[str(source[0])].get("class_type"))
+        types = getattr(node_class, "RETURN_TYPES", ())
+        info = self.input_spec(self.prompt[consumer_id].get("class_type"), input_name)
+        if not isinstance(types, tuple) or source[1] >= len(types) or not isinstance(info, tuple):
+            return False
+        return validate_node_input(types[source[1]], info[0])
+
+    def apply(self, node_id, node, actions, dead_inputs):
+        """
+        Apply one decision, False if it turned out not to be safe.
+        Consumers are only linked past the node when the source type validates against their
+        input (a "*" output no longer sits in between), otherwise the node is kept with just
+        its dead inputs removed.
+        """
+        removed = set()
+        for slot, source in actions.items():
+            if source is None:
+                blocked = self.blocked_nodes(node_id, slot)
+                if blocked is None:
+                    return False
+                removed |= blocked
+
+        for slot, source in actions.items():
+            if source is not None:
+                for consumer_id, name in self.consumers(node_id, slot):
+                    if self.accepts_link(source, consumer_id, name):
+                        self.prompt[consumer_id]["inputs"][name] = list(source)
+        for name, replacement in dead_inputs.items():
+            if replacement is None:
+                del node["inputs"][name]
+            else:
+                node["inputs"][name] = list(replacement)
+        for removed_id in removed:
+            self.prompt.pop(removed_id, None)
+        # A fully bypassed node is gone too, so its lazy inputs no longer hold back other decisions
+        if not self.consumers(node_id):
+            self.prompt.pop(node_id, None)
+        # Rewired inputs can turn previously unresolved nodes constant
+        self.constants.clear()
+
+        self.decisions.append({"node": node_id, "class_type": node.get("class_type"), "blocked": len(removed)})
+        return True
+
+    def prune_unreachable(self, output_ids):
+        """Drop every node no output depends on"""
+        reachable = set()
+        pending = [node_id for node_id in output_ids if node_id in self.prompt]
+        while pending:
+            node_id = pending.pop()
+            if node_id in reachable:
+                continue
+            reachable.add(node_id)
+            for value in self.prompt[node_id].get("inputs", {}).values():
+                if is_link(value) and str(value[0]) in self.prompt:
+                    pending.append(str(value[0]))
+        for node_id in list(self.prompt):
+            if node_id not in reachable:
+                del self.prompt[node_id]
+
+    def run(self):
+        """Resolve decisions until nothing changes"""
+        decided = set()
+        changed = True
+        while changed:
+            changed = False
+            for node_id, node in list(self.prompt.items()):
+                if node_id in decided or node_id not in self.prompt:
+                    continue
+                decision = self.decide(node_id, node)
+                if decision is not None and self.apply(node_id, node, *decision):
+                    decided.add(node_id)
+                    changed = True
+
+    def never_none(self, source):
+        """True if a linked output can't be None, which makes a Passthrough after it a no-op"""
+        node_id, slot = str(source[0]), source[1]
+        node = self.prompt[node_id]
+        if node.get("class_type") == "CRZPassthrough":
+            return True
+        constant, value = self.resolve(source)
+        if constant:
+            return value is not None
+        # Typed outputs are trusted, untyped ones (switches, map dropdowns, routers...) may be None.
+        # str() so AnyType's comparison overrides don't apply
+        types = getattr(self.node_class(node.get("class_type")), "RETURN_TYPES", ())
+        return isinstance(types, tuple) and slot < len(types) and str(types[slot]) != "*"
+
+    def accepts_literal(self, consumer_id, input_name, value):
+        """True if a literal can replace the link on a consumer input and reach the node unchanged"""
+        info = self.input_spec(self.prompt[consumer_id].get("class_type"), input_name)
+        if not isinstance(info, tuple) or not isinstance(info[0], str):
+            return False
+        # Validation casts literals on INT and FLOAT inputs, so the value must already have that type
+        expected = LITERAL_TYPES.get(str(info[0]))
+        if expected is None or isinstance(value, bool) or not isinstance(value, expected):
+            return False
+        # ...and rejects them outside min/max, which a link isn't checked against
+        options = self.input_info(self.prompt[consumer_id].get("class_type"), input_name)
+        return not (("min" in options and value < options["min"]) or ("max" in options and value > options["max"]))
+
+    def fold_node(self, node_id, node, value):
+        """Point the consumers of a node at value (a link or a literal), True if any of them moved"""
+        moved = 0
+        for consumer_id, name in self.consumers(node_id, 0):
+            if is_link(value):
+                # A Passthrough is often a type-agnostic reroute, e.g. an INT slider into a FLOAT input
+                if not self.accepts_link(value, consumer_id, name):
+                    continue
+                self.prompt[consumer_id]["inputs"][name] = list(value)
+            elif self.accepts_literal(consumer_id, name, value):
+                self.prompt[consumer_id]["inputs"][name] = value
+            else:
+                continue
+            moved += 1
+        if not moved:
+            return False
+        if not self.consumers(node_id):
+            self.prompt.pop(node_id, None)
+        self.folded.append({"node": node_id, "class_type": node.get("class_type"), "consumers": moved})
+        return True
+
+    def fold(self):
+        """
+        Collapse Passthrough and Int/Float converter chains.
+        A Passthrough is skipped by linking its consumers to its source, unless that source may
+        be None, which the Passthrough turns into 0, or its type would fail validation against the
+        consumer input. A converter on a constant (and a Passthrough
+        holding one) is replaced by its value in every consumer input that accepts it.
+        Folding never changes the value a consumer receives, so it repeats until whole chains are gone.
+        """
+        changed = True
+        while changed:
+            changed = False
+            for node_id, node in list(self.prompt.items()):
+                if node_id not in self.prompt:
+                    continue
+                class_type = node.get("class_type")
+                if class_type == "CRZPassthrough":
+                    source = node.get("inputs", {}).get("input")
+                    if is_link(source):
+                        if str(source[0]) != node_id and str(source[0]) in self.prompt and self.never_none(source):
+                            changed |= self.fold_node(node_id, node, source)
+                    elif source is not None:
+                        # A literal, e.g. a folded converter
+                        changed |= self.fold_node(node_id, node, source)
+                elif class_type in CONVERTER_NODES:
+                    constant, value = self.resolve([node_id, 0])
+                    if constant:
+                        changed |= self.fold_node(node_id, node, value)
+
+    def output_ids(self):
+        return [node_id for node_id, node in self.prompt.items()
+                if getattr(self.node_class(node.get("class_type")), "OUTPUT_NODE", False)]
+
+def prune_prompt(json_data):
+    """on_prompt handler: statically remove dead CRZ branches and fold trivial nodes before validation, if enabled"""
+    global last_report
+    prompt = json_data.get("prompt")
+    prune = preferences.get("prompt_pruner_enabled")
+    fold = preferences.get("prompt_fold_enabled")
+    if not (prune or fold) or not isinstance(prompt, dict):
+        return json_data
+
+    start = time.perf_counter()
+    try:
+        # Unknown node types are left for ComfyUI's validation to report
+        if not all(isinstance(node, dict) and node.get("class_type") in nodes.NODE_CLASS_MAPPINGS
+                   for node in prompt.values()):
+            return json_data
+
+        working = {str(node_id): {**node, "inputs": dict(node.get("inputs", {}))} for node_id, node in prompt.items()}
+        pruner = PromptPruner(working)
+        if prune:
+            pruner.run()
+        if fold:
+            pruner.fold()
+        output_ids = pruner.output_ids()
+        pruner.prune_unreachable(output_ids)
+
+        # Keep the original if pruning would leave nothing to run or drop a requested target
+        targets = json_data.get("partial_execution_targets") or []
+        if not output_ids or any(str(target) not in working for target in targets):
+            return json_data
+
+        json_data["prompt"] = working
+        last_report = {
+            "prompt_id": json_data.get("prompt_id"),
+            "client_id": json_data.get("client_id"),
+            "nodes_before": len(prompt),
+            "nodes_after": len(working),
+            "pruned": len(prompt) - len(working),
+            "removed": sorted(set(map(str, prompt)) - set(working)),
+            "decisions": pruner.decisions,
+            "folded": pruner.folded,
+            "time_ms": round((time.perf_counter() - start) * 1000, 3),
+        }
+        if last_report["pruned"]:
+            print(f"CRZ pruner: removed {last_report['pruned']} of {len(prompt)} nodes ({len(pruner.folded)} folded)")
+    except Exception as e:
+        print(f"CRZ pruner: skipped, {e}")
+    return json_data
+
+PromptServer.instance.add_on_prompt_handler(prune_prompt)
@@ -0,0 +1,12 @@
+# ComfyUI - CRZ helpers for inspecting API format prompts
+
+def output_is_linked(prompt, unique_id, slot):
+    """True if any node in the prompt takes its input from output slot of node unique_id"""
+    if prompt is None or unique_id is None:
+        return True
+    unique_id = str(unique_id)
+    for node in prompt.values():
+        for value in node.get("inputs", {}).values():
+            if isinstance(value, list) and len(value) == 2 and str(value[0]) == unique_id and value[1] == slot:
+                return True
+    return False
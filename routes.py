@@ -0,0 +1,195 @@
+# ComfyUI - CRZ Server Routes
+import os
+import hashlib
+import asyncio
+import threading
+from aiohttp import web
+from PIL import Image
+import folder_paths
+from server import PromptServer
+from .image_cache import image_cache, get_cache_directory, file_fingerprint
+from .image_decode import open_image
+from .image_folder import IMAGE_EXTENSIONS
+from .preferences import preferences
+from .dashboard_registry import dashboard_registry, index_controls, read_controls, apply_values
+from . import prompt_pruner
+
+def resolve_input_path(filename):
+    """Resolve a filename inside the input directory, or None if it escapes it"""
+    input_dir = os.path.abspath(folder_paths.get_input_directory())
+    full_path = os.path.abspath(os.path.join(input_dir, filename))
+    if os.path.commonpath([input_dir, full_path]) != input_dir:
+        return None
+    return full_path
+
+def make_thumbnail(full_path, thumb_path, size):
+    """Write a size x size bounded thumbnail for full_path to thumb_path"""
+    i = open_image(full_path, (size, size))
+    i.thumbnail((size, size), Image.LANCZOS)
+    if i.mode not in ("RGB", "RGBA"):
+        i = i.convert("RGBA")
+    # Per thread, so a concurrent writer never shares (or renames away) our temp file
+    tmp_path = f"{thumb_path}.{threading.get_ident()}.tmp"
+    try:
+        i.save(tmp_path, format="WEBP", quality=85)
+        os.replace(tmp_path, thumb_path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+# Thumbnails being generated, keyed like the cache files so concurrent requests share one job
+thumbnail_jobs = {}
+
+@PromptServer.instance.routes.get("/crz/thumbnail")
+async def crz_thumbnail(request):
+    """Small cached thumbnail of an input image, for the Image Selector widget"""
+    filename = request.rel_url.query.get("filename", "")
+    try:
+        size = int(request.rel_url.query.get("size", preferences.get("image_selector_thumbnail_size")))
+    except ValueError:
+        return web.Response(status=400)
+    size = max(16, min(size, 1024))
+
+    full_path = resolve_input_path(filename) if filename else None
+    if full_path is None:
+        return web.Response(status=400)
+    fingerprint = file_fingerprint(full_path)
+    if not fingerprint:
+        return web.Response(status=404)
+
+    # One thumbnail per file version and size, the same key doubles as the ETag
+    key = hashlib.sha256(f"{full_path}:{fingerprint}:{size}".encode("utf-8")).hexdigest()
+    etag = f'"{key[:32]}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag in [tag.strip() for tag in request.headers.get("If-None-Match", "").split(",")]:
+        return web.Response(status=304, headers=headers)
+
+    thumb_path = os.path.join(get_cache_directory("thumbnails"), key + ".webp")
+    if not os.path.exists(thumb_path):
+        job = thumbnail_jobs.get(key)
+        if job is None:
+            job = asyncio.get_running_loop().run_in_executor(None, make_thumbnail, full_path, thumb_path, size)
+            thumbnail_jobs[key] = job
+            job.add_done_callback(lambda _: thumbnail_jobs.pop(key, None))
+        try:
+            # Shielded, a client going away must not cancel the job for the other requests
+            await asyncio.shield(job)
+        except Exception as e:
+            print(f"CRZ thumbnail: failed for {filename}: {e}")
+            return web.Response(status=500)
+
+    with open(thumb_path, "rb") as f:
+        body = f.read()
+    return web.Response(body=body, content_type="image/webp", headers=headers)
+
+@PromptServer.instance.routes.get("/crz/cache/stats")
+async def crz_cache_stats(request):
+    """Counters of the Image Selector's decoded image cache (entries, bytes, hits, misses, evictions)"""
+    return web.json_response(image_cache.stats())
+
+@PromptServer.instance.routes.post("/crz/upload/image")
+async def crz_upload_image(request):
+    """
+    Content-addressed upload for the Image Selector.
+    Each unique image is stored once in the input directory under a name derived from its
+    SHA-256, re-uploading the same bytes returns the existing file instead of a new copy.
+    """
+    post = await request.post()
+    image = post.get("image")
+    if image is None or not hasattr(image, "file"):
+        return web.Response(status=400)
+
+    data = image.file.read()
+    ext = os.path.splitext(image.filename or "")[1].lower()
+    if ext not in IMAGE_EXTENSIONS:
+        ext = ".png"
+    digest = hashlib.sha256(data).hexdigest()
+    name = f"crz_{digest[:16]}{ext}"
+    full_path = os.path.join(folder_paths.get_input_directory(), name)
+
+    existing = os.path.exists(full_path) and os.path.getsize(full_path) == len(data)
+    if not existing:
+        tmp_path = f"{full_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, full_path)
+
+    return web.json_response({"name": name, "subfolder": "", "type": "input", "existing": existing})
+
+@PromptServer.instance.routes.get("/crz/values")
+async def crz_get_values(request):
+    """
+    All registered dashboard values in one response.
+    Pass ?since=<version> to poll cheaply, unchanged registries only return the version.
+    """
+    version, values, names = dashboard_registry.snapshot()
+    since = request.rel_url.query.get("since")
+    if since is not None and since == str(version):
+        return web.json_response({"version": version, "changed": False})
+    return web.json_response({"version": version, "changed": True, "values": values, "names": names})
+
+@PromptServer.instance.routes.post("/crz/values")
+async def crz_set_values(request):
+    """Bulk write {"values": {node id or name: value}} to the registry, no-op writes don't bump the version"""
+    try:
+        data = await request.json()
+    except ValueError:
+        return web.Response(status=400)
+    values = data.get("values") if isinstance(data, dict) else None
+    if not isinstance(values, dict):
+        return web.Response(status=400)
+    version, changed = dashboard_registry.set_many(values)
+    return web.json_response({"version": version, "changed": changed})
+
+@PromptServer.instance.routes.post("/crz/values/read")
+async def crz_read_values(request):
+    """Every CRZ control value in {"prompt": <API format prompt>}, by node id with its name"""
+    try:
+        data = await request.json()
+    except ValueError:
+        return web.Response(status=400)
+    prompt = data.get("prompt") if isinstance(data, dict) else None
+    if not isinstance(prompt, dict):
+        return web.Response(status=400)
+    return web.json_response({"controls": read_controls(prompt)})
+
+@PromptServer.instance.routes.post("/crz/values/apply")
+async def crz_apply_values(request):
+    """
+    Patch CRZ control values into a prompt or template in one request.
+    Body: {"prompt": <API format prompt>, "values": {node id or name: value}} for one prompt, or
+    "variations": [{...}, ...] to build many prompts at once (e.g. a parameter sweep).
+    Names are slider names or node titles. The prompt is indexed once per request, and each
+    result reports what changed so no-op variations can be skipped.
+    """
+    try:
+        data = await request.json()
+    except ValueError:
+        return web.Response(status=400)
+    prompt = data.get("prompt") if isinstance(data, dict) else None
+    if not isinstance(prompt, dict):
+        return web.Response(status=400)
+
+    variations = data.get("variations")
+    single = variations is None
+    if single:
+        variations = [data.get("values") or {}]
+    if not isinstance(variations, list) or not all(isinstance(values, dict) for values in variations):
+        return web.Response(status=400)
+
+    index = index_controls(prompt)
+    results = []
+    for values in variations:
+        patched, changed, unknown = apply_values(prompt, index, values)
+        results.append({"prompt": patched, "changed": changed, "unknown": unknown})
+    if single:
+        return web.json_response(results[0])
+    return web.json_response({"results": results})
+
+@PromptServer.instance.routes.get("/crz/pruner/report")
+async def crz_pruner_report(request):
+    """What the prompt pruner removed from the last queued prompt"""
+    return web.json_response({"enabled": bool(preferences.get("prompt_pruner_enabled")), **prompt_pruner.last_report})
@@ -1,5 +1,8 @@
 # ComfyUI - CRZ Switch
+import json
+from functools import lru_cache
 import nodes
+from .dynamic_inputs import lazy_dynamic_inputs
 
 # This is a hack to work around ComfyUI's type validation system
 class AnyTypeStr(str):
@@ -38,10 +41,80 @@ class CRZSwitch:
         selected = true_input if value else false_input
         return (selected,)
 
+@lru_cache(maxsize=64)
+def parse_switch_keys(keys):
+    """Parse keys (a JSON list or comma separated) into key -> input index, memoized per string"""
+    keys = keys.strip()
+    try:
+        names = json.loads(keys) if keys.startswith("[") else keys.split(",")
+    except ValueError:
+        names = keys.split(",")
+    key_index = {}
+    for index, name in enumerate(names):
+        key_index.setdefault(str(name).strip(), index)
+    return key_index
+
+def get_switch_index(select, keys=""):
+    """
+    Resolve the switch selector to an input index.
+    Booleans (e.g. a Compare result) pick input_0 for False and input_1 for True, numbers are
+    used as the index, strings (e.g. a Custom Dropdown value) are looked up in keys.
+    """
+    if isinstance(select, bool):
+        return int(select)
+    if isinstance(select, (int, float)):
+        return int(select)
+    select = str(select).strip()
+    key_index = parse_switch_keys(keys)
+    if select in key_index:
+        return key_index[select]
+    try:
+        return int(select)
+    except ValueError:
+        # Unknown keys fall back to the first input, like Map Custom Dropdown
+        return 0
+
+class CRZIndexSwitch:
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "select": (AnyType, {"default": 0}),  # INT index, BOOLEAN or dropdown string
+            },
+            "optional": lazy_dynamic_inputs("input_", {
+                "keys": ("STRING", {"default": ""}),
+                "input_0": (AnyType, {"lazy": True}),
+                "input_1": (AnyType, {"lazy": True}),
+            })
+        }
+
+    RETURN_TYPES = (AnyType,)
+    RETURN_NAMES = ("output",)
+    FUNCTION = "switch_inputs"
+    CATEGORY = 'CRZ'
+
+    def check_lazy_status(self, select=0, keys="", **kwargs):
+        # Only evaluate the one input that will be used, unconnected inputs are not in kwargs
+        needed = f"input_{get_switch_index(select, keys)}"
+        if needed in kwargs and kwargs[needed] is None:
+            return [needed]
+        return []
+
+    def switch_inputs(self, select=0, keys="", **kwargs):
+        # Unconnected or out of range selections output None
+        return (kwargs.get(f"input_{get_switch_index(select, keys)}"),)
+
+    @classmethod
+    def VALIDATE_INPUTS(s, select=None, **kwargs):
+        # Accept any type for the selector
+        return True
+
 NODE_CLASS_MAPPINGS = {
     "CRZSwitch": CRZSwitch,
+    "CRZIndexSwitch": CRZIndexSwitch,
 }
 
 NODE_DISPLAY_NAME_MAPPINGS = {
     "CRZSwitch": "CRZ Switch",
+    "CRZIndexSwitch": "CRZ Index Switch",
 } 
\ No newline at end of file
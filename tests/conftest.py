@@ -0,0 +1,66 @@
+# Shared fixtures: the CRZ package imported outside of ComfyUI, with its modules stubbed out
+import importlib
+import sys
+import types
+from pathlib import Path
+
+import pytest
+import torch
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent
+PACKAGE_NAME = "crz_under_test"
+
+def common_upscale(samples, width, height, upscale_method, crop):
+    """comfy.utils.common_upscale for the interpolate based methods, including its center crop"""
+    if crop == "center":
+        old_width = samples.shape[-1]
+        old_height = samples.shape[-2]
+        old_aspect = old_width / old_height
+        new_aspect = width / height
+        x = 0
+        y = 0
+        if old_aspect > new_aspect:
+            x = round((old_width - old_width * (new_aspect / old_aspect)) / 2)
+        elif old_aspect < new_aspect:
+            y = round((old_height - old_height * (old_aspect / new_aspect)) / 2)
+        samples = samples.narrow(-2, y, old_height - y * 2).narrow(-1, x, old_width - x * 2)
+    return torch.nn.functional.interpolate(samples, size=(height, width), mode=upscale_method)
+
+class StubbedPackage:
+    """Handle on the stand-in package, load() imports one of its modules"""
+    def __init__(self, modules):
+        self.modules = modules
+
+    @property
+    def nodes(self):
+        return self.modules["nodes"]
+
+    def load(self, name):
+        return importlib.import_module(f"{PACKAGE_NAME}.{name}")
+
+@pytest.fixture(scope="module")
+def crz(tmp_path_factory):
+    """Install stub ComfyUI modules (nodes, server, folder_paths, comfy.utils) for one test module"""
+    input_dir = tmp_path_factory.mktemp("input")
+    modules = {name: types.ModuleType(name) for name in ("nodes", "server", "folder_paths", "comfy", "comfy.utils")}
+    modules["nodes"].NODE_CLASS_MAPPINGS = {}
+    server = types.SimpleNamespace(add_on_prompt_handler=lambda handler: None)
+    modules["server"].PromptServer = types.SimpleNamespace(instance=server)
+    modules["folder_paths"].get_input_directory = lambda: str(input_dir)
+    modules["comfy.utils"].common_upscale = common_upscale
+    modules["comfy"].utils = modules["comfy.utils"]
+    modules[PACKAGE_NAME] = types.ModuleType(PACKAGE_NAME)
+    modules[PACKAGE_NAME].__path__ = [str(PACKAGE_DIR)]
+
+    saved = {name: sys.modules.get(name) for name in modules}
+    sys.modules.update(modules)
+    try:
+        yield StubbedPackage(modules)
+    finally:
+        for name, old in saved.items():
+            if old is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = old
+        for name in [name for name in sys.modules if name.startswith(PACKAGE_NAME + ".")]:
+            del sys.modules[name]
@@ -0,0 +1,27 @@
+# Tests for the Image Folder file listing
+import os
+
+import pytest
+
+@pytest.fixture(scope="module")
+def image_folder(crz):
+    module = crz.load("image_folder")
+    input_dir = module.folder_paths.get_input_directory()
+    for name in ("b.png", "a.jpg", "notes.txt", os.path.join("sub", "c.png"), os.path.join("sub", "deeper", "d.webp")):
+        path = os.path.join(input_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(b"")
+    return module
+
+def test_folder_lists_its_images_relative_to_the_input_dir(image_folder):
+    assert image_folder.list_folder_images("") == ["a.jpg", "b.png"]
+    assert image_folder.list_folder_images("sub") == [os.path.join("sub", "c.png")]
+
+def test_recursive_glob(image_folder):
+    assert image_folder.list_folder_images("sub/**/*.*") == [
+        os.path.join("sub", "c.png"), os.path.join("sub", "deeper", "d.webp")]
+
+def test_glob_never_leaves_the_input_dir(image_folder):
+    assert image_folder.list_folder_images("../*") == []
+    assert image_folder.list_folder_images("/*") == []
@@ -0,0 +1,53 @@
+# Tests for the Image Selector batch building
+import pytest
+import torch
+
+@pytest.fixture(scope="module")
+def selector(crz):
+    return crz.load("image_selector")
+
+def transparent_left(width, height, transparent_columns):
+    """
+    An RGB image and its LoadImage style mask (1 where transparent).
+    The red channel is 1 exactly where the source was transparent, so it can be
+    compared against the mask after both went through the batch.
+    """
+    mask = torch.zeros((1, height, width))
+    mask[:, :, :transparent_columns] = 1.0
+    image = torch.zeros((1, height, width, 3))
+    image[..., 0] = mask
+    return image, mask
+
+@pytest.mark.parametrize("resize_filter", ["bilinear", "nearest-exact"])
+def test_mismatched_mask_rows_line_up_with_image_rows(selector, resize_filter):
+    square = torch.full((1, 100, 100, 3), 0.5)
+    # 300x100 with columns 0-124 transparent, center cropped to columns 100-199 in the batch,
+    # which leaves 25 transparent columns (stretching the mask instead would give about 42)
+    wide, wide_mask = transparent_left(300, 100, 125)
+
+    image_batch, _ = selector.make_image_batch([square, wide], "first", resize_filter=resize_filter)
+    mask_batch, _ = selector.make_mask_batch([None, wide_mask], image_batch.shape[1], image_batch.shape[2],
+                                             resize_filter)
+
+    assert mask_batch.shape == (2, 100, 100)
+    assert torch.allclose(mask_batch[1], image_batch[1, ..., 0], atol=1e-6)
+    assert mask_batch[1, :, :24].min() == 1.0
+    assert mask_batch[1, :, 26:].max() == 0.0
+    assert mask_batch[0].max() == 0.0
+
+def test_matching_mask_rows_are_views(selector):
+    image, mask = transparent_left(64, 64, 16)
+    mask_batch, masks = selector.make_mask_batch([mask, mask.clone()], 64, 64)
+    assert torch.equal(mask_batch[0], mask[0])
+    assert masks[1].data_ptr() == mask_batch[1:2].data_ptr()
+
+def test_draft_size_only_applies_to_unwired_slots(selector):
+    prompt = {
+        "5": {"class_type": "CRZImageSelector", "inputs": {}},
+        "6": {"class_type": "SaveImage", "inputs": {"images": ["5", 0]}},
+        "7": {"class_type": "MaskPreview", "inputs": {"mask": ["5", 10]}},
+    }
+    assert selector.slot_draft_sizes((512, 512), prompt, "5") == [None, (512, 512), None] + [(512, 512)] * 3
+    # Without the prompt every slot might be wired
+    assert selector.slot_draft_sizes((512, 512)) == [None] * 6
+    assert selector.slot_draft_sizes(None, prompt, "5") == [None] * 6
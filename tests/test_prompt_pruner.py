@@ -0,0 +1,162 @@
+# Tests for the CRZ prompt pruner
+import copy
+
+import pytest
+
+class KSampler:
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "cfg": ("FLOAT", {"default": 8.0, "min": 0.0, "max": 100.0}),
+                "sampler_name": (["euler", "ddim"],),
+            }
+        }
+
+    RETURN_TYPES = ("LATENT",)
+    FUNCTION = "sample"
+    OUTPUT_NODE = True
+
+class LoadImage:
+    @classmethod
+    def INPUT_TYPES(s):
+        return {"required": {}}
+
+    RETURN_TYPES = ("IMAGE",)
+    FUNCTION = "load"
+
+class SaveImage:
+    @classmethod
+    def INPUT_TYPES(s):
+        return {"required": {"images": ("IMAGE",)}}
+
+    RETURN_TYPES = ()
+    FUNCTION = "save"
+    OUTPUT_NODE = True
+
+@pytest.fixture(scope="module")
+def pruner(crz):
+    """The prompt_pruner module, with a node registry of CRZ controls and a few core nodes"""
+    mappings = {"KSampler": KSampler, "LoadImage": LoadImage, "SaveImage": SaveImage}
+    for name in ("boolean_toggle", "float_slider", "integer_slider", "string_node", "passthrough", "switch",
+                 "float_to_int", "int_to_float"):
+        mappings.update(crz.load(name).NODE_CLASS_MAPPINGS)
+    crz.nodes.NODE_CLASS_MAPPINGS = mappings
+    return crz.load("prompt_pruner")
+
+def run_pruner(pruner, prompt, fold=False):
+    working = copy.deepcopy(prompt)
+    instance = pruner.PromptPruner(working)
+    instance.run()
+    if fold:
+        instance.fold()
+    instance.prune_unreachable(instance.output_ids())
+    return working
+
+def test_switch_is_bypassed_when_source_type_matches(pruner):
+    prompt = {
+        "1": {"class_type": "CRZBooleanToggle", "inputs": {"value": True}},
+        "2": {"class_type": "LoadImage", "inputs": {}},
+        "3": {"class_type": "LoadImage", "inputs": {}},
+        "4": {"class_type": "CRZSwitch", "inputs": {"true_input": ["2", 0], "false_input": ["3", 0], "value": ["1", 0]}},
+        "5": {"class_type": "SaveImage", "inputs": {"images": ["4", 0]}},
+    }
+    pruned = run_pruner(pruner, prompt)
+    assert set(pruned) == {"2", "5"}
+    assert pruned["5"]["inputs"]["images"] == ["2", 0]
+
+def test_switch_is_kept_for_string_into_combo(pruner):
+    prompt = {
+        "1": {"class_type": "CRZBooleanToggle", "inputs": {"value": True}},
+        "2": {"class_type": "CRZStringNode", "inputs": {"text": "euler"}},
+        "3": {"class_type": "CRZStringNode", "inputs": {"text": "ddim"}},
+        "4": {"class_type": "CRZSwitch", "inputs": {"true_input": ["2", 0], "false_input": ["3", 0], "value": ["1", 0]}},
+        "5": {"class_type": "KSampler", "inputs": {"cfg": 8.0, "sampler_name": ["4", 0]}},
+    }
+    pruned = run_pruner(pruner, prompt)
+    # A STRING -> COMBO link fails validation, the switch stays and only the dead branch goes
+    assert pruned["5"]["inputs"]["sampler_name"] == ["4", 0]
+    assert pruned["4"]["inputs"]["false_input"] == ["2", 0]
+    assert "3" not in pruned
+
+def test_switch_is_kept_for_int_into_float(pruner):
+    prompt = {
+        "1": {"class_type": "CRZBooleanToggle", "inputs": {"value": False}},
+        "2": {"class_type": "CRZIntegerSlider", "inputs": {"value": 7}},
+        "3": {"class_type": "CRZIntegerSlider", "inputs": {"value": 5}},
+        "4": {"class_type": "CRZSwitch", "inputs": {"true_input": ["2", 0], "false_input": ["3", 0], "value": ["1", 0]}},
+        "5": {"class_type": "KSampler", "inputs": {"cfg": ["4", 0], "sampler_name": "euler"}},
+    }
+    pruned = run_pruner(pruner, prompt)
+    assert pruned["5"]["inputs"]["cfg"] == ["4", 0]
+    assert pruned["4"]["inputs"]["true_input"] == ["3", 0]
+    assert "2" not in pruned
+
+def test_validate_node_input_matches_comfyui(pruner):
+    any_type = pruner.nodes.NODE_CLASS_MAPPINGS["CRZSwitch"].RETURN_TYPES[0]
+    assert pruner.validate_node_input("IMAGE", "IMAGE")
+    assert pruner.validate_node_input(any_type, ["euler", "ddim"])
+    assert pruner.validate_node_input("INT", any_type)
+    assert not pruner.validate_node_input("STRING", ["euler", "ddim"])
+    assert not pruner.validate_node_input("INT", "FLOAT")
+
+def test_passthrough_chain_is_folded(pruner):
+    prompt = {
+        "1": {"class_type": "LoadImage", "inputs": {}},
+        "2": {"class_type": "CRZPassthrough", "inputs": {"input": ["1", 0]}},
+        "3": {"class_type": "CRZPassthrough", "inputs": {"input": ["2", 0]}},
+        "4": {"class_type": "SaveImage", "inputs": {"images": ["3", 0]}},
+    }
+    pruned = run_pruner(pruner, prompt, fold=True)
+    assert set(pruned) == {"1", "4"}
+    assert pruned["4"]["inputs"]["images"] == ["1", 0]
+
+def test_passthrough_is_kept_for_string_into_combo(pruner):
+    prompt = {
+        "1": {"class_type": "CRZStringNode", "inputs": {"text": "euler"}},
+        "2": {"class_type": "CRZPassthrough", "inputs": {"input": ["1", 0]}},
+        "3": {"class_type": "KSampler", "inputs": {"cfg": 8.0, "sampler_name": ["2", 0]}},
+    }
+    pruned = run_pruner(pruner, prompt, fold=True)
+    assert pruned["3"]["inputs"]["sampler_name"] == ["2", 0]
+
+def test_passthrough_is_kept_for_int_into_float(pruner):
+    prompt = {
+        "1": {"class_type": "CRZIntegerSlider", "inputs": {"value": 7}},
+        "2": {"class_type": "CRZPassthrough", "inputs": {"input": ["1", 0]}},
+        "3": {"class_type": "CRZPassthrough", "inputs": {"input": ["2", 0]}},
+        "4": {"class_type": "KSampler", "inputs": {"cfg": ["3", 0], "sampler_name": "euler"}},
+    }
+    pruned = run_pruner(pruner, prompt, fold=True)
+    # The chain still collapses to one Passthrough, which keeps the "*" output in front of cfg
+    passthrough_id = pruned["4"]["inputs"]["cfg"][0]
+    assert pruned[passthrough_id]["class_type"] == "CRZPassthrough"
+    assert pruned[passthrough_id]["inputs"]["input"] == ["1", 0]
+    assert len(pruned) == 3
+
+def test_converter_is_folded_into_matching_input(pruner):
+    prompt = {
+        "1": {"class_type": "CRZIntegerSlider", "inputs": {"value": 7}},
+        "2": {"class_type": "CRZIntToFloat", "inputs": {"INT": ["1", 0]}},
+        "3": {"class_type": "KSampler", "inputs": {"cfg": ["2", 0], "sampler_name": "euler"}},
+    }
+    pruned = run_pruner(pruner, prompt, fold=True)
+    assert set(pruned) == {"3"}
+    assert pruned["3"]["inputs"]["cfg"] == 7.0
+
+def test_unbounded_map_dropdown_drops_unselected_options(pruner, crz):
+    crz.nodes.NODE_CLASS_MAPPINGS.update(crz.load("map_dropdown").NODE_CLASS_MAPPINGS)
+    crz.nodes.NODE_CLASS_MAPPINGS.update(crz.load("custom_dropdown").NODE_CLASS_MAPPINGS)
+    prompt = {
+        "1": {"class_type": "CRZCustomDropdown", "inputs": {"dropdown": "c", "dropdown_options": "[]"}},
+        "2": {"class_type": "LoadImage", "inputs": {}},
+        "3": {"class_type": "LoadImage", "inputs": {}},
+        "4": {"class_type": "CRZMapDropdownUnbounded", "inputs": {
+            "custom_dropdown": ["1", 0], "dropdown_options": '["a", "b", "c"]',
+            "option_0": ["2", 0], "option_12": ["3", 0], "option_2": ["3", 0]}},
+        "5": {"class_type": "SaveImage", "inputs": {"images": ["4", 0]}},
+    }
+    pruned = run_pruner(pruner, prompt)
+    assert pruned["5"]["inputs"]["images"] == ["3", 0]
+    # The Custom Dropdown is an output node and stays, the unselected option's source goes
+    assert set(pruned) == {"1", "3", "5"}